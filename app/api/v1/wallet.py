@@ -17,7 +17,7 @@ from app.api.v1.auth import get_current_user
 from app.config import get_settings, Settings
 from app.chains import (
     CHAIN_REGISTRY,
-    CHAIN_STATS,
+    chain_stats,
     get_all_chains,
     get_chain,
     get_evm_chains,
@@ -360,7 +360,7 @@ async def get_chain_stats() -> ChainStatsResponse:
     
     Returns aggregate statistics about supported chains.
     """
-    return ChainStatsResponse(**CHAIN_STATS)
+    return ChainStatsResponse(**chain_stats())
 
 
 @router.get("/chains/{chain_key}", response_model=ChainInfo)
@@ -11,7 +11,9 @@ Supported Signing Curves:
 """
 
 from dataclasses import dataclass
+from functools import lru_cache
 from enum import Enum
+from types import MappingProxyType
 from typing import Optional
 
 
@@ -83,278 +85,109 @@ class ChainConfig:
 # CHAIN REGISTRY - Top 18 Blockchains by Market Cap & Ecosystem Activity
 # =============================================================================
 
-CHAIN_REGISTRY: dict[str, ChainConfig] = {
+# Row layout (positional, matching ChainConfig field order, prefixed by
+# the registry key):
+#   (key, chain_id, name, symbol, chain_type, signing_curve, address_format,
+#    decimals, rpc_env_var, default_rpc, explorer_url,
+#    is_testnet, eip155, supports_eip1559, mpc_compatible, coin_type)
+_CHAIN_ROWS: tuple[tuple, ...] = (
     # --- Bitcoin ---
-    "bitcoin": ChainConfig(
-        chain_id="bitcoin",
-        name="Bitcoin",
-        symbol="BTC",
-        chain_type=ChainType.UTXO,
-        signing_curve=SigningCurve.ECDSA_SECP256K1,
-        address_format=AddressFormat.BECH32,
-        decimals=8,
-        rpc_env_var="WHALE_BITCOIN_RPC",
-        default_rpc="https://btc.llamarpc.com",
-        explorer_url="https://blockstream.info",
-        coin_type=0,
-    ),
+    ("bitcoin", "bitcoin", "Bitcoin", "BTC",
+     ChainType.UTXO, SigningCurve.ECDSA_SECP256K1, AddressFormat.BECH32, 8,
+     "WHALE_BITCOIN_RPC", "https://btc.llamarpc.com", "https://blockstream.info",
+     False, False, False, True, 0),
     
     # --- Ethereum & Layer 2s ---
-    "ethereum": ChainConfig(
-        chain_id="1",
-        name="Ethereum",
-        symbol="ETH",
-        chain_type=ChainType.EVM,
-        signing_curve=SigningCurve.ECDSA_SECP256K1,
-        address_format=AddressFormat.HEX_CHECKSUM,
-        decimals=18,
-        rpc_env_var="WHALE_ETHEREUM_RPC",
-        default_rpc="https://eth.llamarpc.com",
-        explorer_url="https://etherscan.io",
-        eip155=True,
-        supports_eip1559=True,
-        coin_type=60,
-    ),
-    "arbitrum": ChainConfig(
-        chain_id="42161",
-        name="Arbitrum One",
-        symbol="ETH",
-        chain_type=ChainType.EVM,
-        signing_curve=SigningCurve.ECDSA_SECP256K1,
-        address_format=AddressFormat.HEX_CHECKSUM,
-        decimals=18,
-        rpc_env_var="WHALE_ARBITRUM_RPC",
-        default_rpc="https://arb1.arbitrum.io/rpc",
-        explorer_url="https://arbiscan.io",
-        eip155=True,
-        supports_eip1559=True,
-        coin_type=60,
-    ),
-    "optimism": ChainConfig(
-        chain_id="10",
-        name="Optimism",
-        symbol="ETH",
-        chain_type=ChainType.EVM,
-        signing_curve=SigningCurve.ECDSA_SECP256K1,
-        address_format=AddressFormat.HEX_CHECKSUM,
-        decimals=18,
-        rpc_env_var="WHALE_OPTIMISM_RPC",
-        default_rpc="https://mainnet.optimism.io",
-        explorer_url="https://optimistic.etherscan.io",
-        eip155=True,
-        supports_eip1559=True,
-        coin_type=60,
-    ),
-    "base": ChainConfig(
-        chain_id="8453",
-        name="Base",
-        symbol="ETH",
-        chain_type=ChainType.EVM,
-        signing_curve=SigningCurve.ECDSA_SECP256K1,
-        address_format=AddressFormat.HEX_CHECKSUM,
-        decimals=18,
-        rpc_env_var="WHALE_BASE_RPC",
-        default_rpc="https://mainnet.base.org",
-        explorer_url="https://basescan.org",
-        eip155=True,
-        supports_eip1559=True,
-        coin_type=60,
-    ),
-    "polygon": ChainConfig(
-        chain_id="137",
-        name="Polygon",
-        symbol="MATIC",
-        chain_type=ChainType.EVM,
-        signing_curve=SigningCurve.ECDSA_SECP256K1,
-        address_format=AddressFormat.HEX_CHECKSUM,
-        decimals=18,
-        rpc_env_var="WHALE_POLYGON_RPC",
-        default_rpc="https://polygon-rpc.com",
-        explorer_url="https://polygonscan.com",
-        eip155=True,
-        supports_eip1559=True,
-        coin_type=60,
-    ),
+    ("ethereum", "1", "Ethereum", "ETH",
+     ChainType.EVM, SigningCurve.ECDSA_SECP256K1, AddressFormat.HEX_CHECKSUM, 18,
+     "WHALE_ETHEREUM_RPC", "https://eth.llamarpc.com", "https://etherscan.io",
+     False, True, True, True, 60),
+    ("arbitrum", "42161", "Arbitrum One", "ETH",
+     ChainType.EVM, SigningCurve.ECDSA_SECP256K1, AddressFormat.HEX_CHECKSUM, 18,
+     "WHALE_ARBITRUM_RPC", "https://arb1.arbitrum.io/rpc", "https://arbiscan.io",
+     False, True, True, True, 60),
+    ("optimism", "10", "Optimism", "ETH",
+     ChainType.EVM, SigningCurve.ECDSA_SECP256K1, AddressFormat.HEX_CHECKSUM, 18,
+     "WHALE_OPTIMISM_RPC", "https://mainnet.optimism.io", "https://optimistic.etherscan.io",
+     False, True, True, True, 60),
+    ("base", "8453", "Base", "ETH",
+     ChainType.EVM, SigningCurve.ECDSA_SECP256K1, AddressFormat.HEX_CHECKSUM, 18,
+     "WHALE_BASE_RPC", "https://mainnet.base.org", "https://basescan.org",
+     False, True, True, True, 60),
+    ("polygon", "137", "Polygon", "MATIC",
+     ChainType.EVM, SigningCurve.ECDSA_SECP256K1, AddressFormat.HEX_CHECKSUM, 18,
+     "WHALE_POLYGON_RPC", "https://polygon-rpc.com", "https://polygonscan.com",
+     False, True, True, True, 60),
     
     # --- Other EVM Chains ---
-    "bsc": ChainConfig(
-        chain_id="56",
-        name="BNB Smart Chain",
-        symbol="BNB",
-        chain_type=ChainType.EVM,
-        signing_curve=SigningCurve.ECDSA_SECP256K1,
-        address_format=AddressFormat.HEX_CHECKSUM,
-        decimals=18,
-        rpc_env_var="WHALE_BSC_RPC",
-        default_rpc="https://bsc-dataseed.binance.org",
-        explorer_url="https://bscscan.com",
-        eip155=True,
-        supports_eip1559=False,
-        coin_type=60,
-    ),
-    "avalanche": ChainConfig(
-        chain_id="43114",
-        name="Avalanche C-Chain",
-        symbol="AVAX",
-        chain_type=ChainType.EVM,
-        signing_curve=SigningCurve.ECDSA_SECP256K1,
-        address_format=AddressFormat.HEX_CHECKSUM,
-        decimals=18,
-        rpc_env_var="WHALE_AVALANCHE_RPC",
-        default_rpc="https://api.avax.network/ext/bc/C/rpc",
-        explorer_url="https://snowtrace.io",
-        eip155=True,
-        supports_eip1559=True,
-        coin_type=60,
-    ),
-    "fantom": ChainConfig(
-        chain_id="250",
-        name="Fantom Opera",
-        symbol="FTM",
-        chain_type=ChainType.EVM,
-        signing_curve=SigningCurve.ECDSA_SECP256K1,
-        address_format=AddressFormat.HEX_CHECKSUM,
-        decimals=18,
-        rpc_env_var="WHALE_FANTOM_RPC",
-        default_rpc="https://rpc.ftm.tools",
-        explorer_url="https://ftmscan.com",
-        eip155=True,
-        supports_eip1559=False,
-        coin_type=60,
-    ),
+    ("bsc", "56", "BNB Smart Chain", "BNB",
+     ChainType.EVM, SigningCurve.ECDSA_SECP256K1, AddressFormat.HEX_CHECKSUM, 18,
+     "WHALE_BSC_RPC", "https://bsc-dataseed.binance.org", "https://bscscan.com",
+     False, True, False, True, 60),
+    ("avalanche", "43114", "Avalanche C-Chain", "AVAX",
+     ChainType.EVM, SigningCurve.ECDSA_SECP256K1, AddressFormat.HEX_CHECKSUM, 18,
+     "WHALE_AVALANCHE_RPC", "https://api.avax.network/ext/bc/C/rpc", "https://snowtrace.io",
+     False, True, True, True, 60),
+    ("fantom", "250", "Fantom Opera", "FTM",
+     ChainType.EVM, SigningCurve.ECDSA_SECP256K1, AddressFormat.HEX_CHECKSUM, 18,
+     "WHALE_FANTOM_RPC", "https://rpc.ftm.tools", "https://ftmscan.com",
+     False, True, False, True, 60),
     
     # --- Solana ---
-    "solana": ChainConfig(
-        chain_id="solana",
-        name="Solana",
-        symbol="SOL",
-        chain_type=ChainType.SVM,
-        signing_curve=SigningCurve.EDDSA_ED25519,
-        address_format=AddressFormat.BASE58,
-        decimals=9,
-        rpc_env_var="WHALE_SOLANA_RPC",
-        default_rpc="https://api.mainnet-beta.solana.com",
-        explorer_url="https://solscan.io",
-        coin_type=501,
-    ),
+    ("solana", "solana", "Solana", "SOL",
+     ChainType.SVM, SigningCurve.EDDSA_ED25519, AddressFormat.BASE58, 9,
+     "WHALE_SOLANA_RPC", "https://api.mainnet-beta.solana.com", "https://solscan.io",
+     False, False, False, True, 501),
     
     # --- Move-based Chains ---
-    "sui": ChainConfig(
-        chain_id="sui",
-        name="Sui",
-        symbol="SUI",
-        chain_type=ChainType.MOVE,
-        signing_curve=SigningCurve.EDDSA_ED25519,
-        address_format=AddressFormat.HEX_CHECKSUM,
-        decimals=9,
-        rpc_env_var="WHALE_SUI_RPC",
-        default_rpc="https://fullnode.mainnet.sui.io",
-        explorer_url="https://suiscan.xyz",
-        coin_type=784,
-    ),
-    "aptos": ChainConfig(
-        chain_id="aptos",
-        name="Aptos",
-        symbol="APT",
-        chain_type=ChainType.MOVE,
-        signing_curve=SigningCurve.EDDSA_ED25519,
-        address_format=AddressFormat.HEX_CHECKSUM,
-        decimals=8,
-        rpc_env_var="WHALE_APTOS_RPC",
-        default_rpc="https://fullnode.mainnet.aptoslabs.com/v1",
-        explorer_url="https://aptoscan.com",
-        coin_type=637,
-    ),
+    ("sui", "sui", "Sui", "SUI",
+     ChainType.MOVE, SigningCurve.EDDSA_ED25519, AddressFormat.HEX_CHECKSUM, 9,
+     "WHALE_SUI_RPC", "https://fullnode.mainnet.sui.io", "https://suiscan.xyz",
+     False, False, False, True, 784),
+    ("aptos", "aptos", "Aptos", "APT",
+     ChainType.MOVE, SigningCurve.EDDSA_ED25519, AddressFormat.HEX_CHECKSUM, 8,
+     "WHALE_APTOS_RPC", "https://fullnode.mainnet.aptoslabs.com/v1", "https://aptoscan.com",
+     False, False, False, True, 637),
     
     # --- Cosmos Ecosystem ---
-    "cosmos": ChainConfig(
-        chain_id="cosmoshub-4",
-        name="Cosmos Hub",
-        symbol="ATOM",
-        chain_type=ChainType.CUSTOM,
-        signing_curve=SigningCurve.ECDSA_SECP256K1,
-        address_format=AddressFormat.BECH32,
-        decimals=6,
-        rpc_env_var="WHALE_COSMOS_RPC",
-        default_rpc="https://cosmos-rpc.publicnode.com:443",
-        explorer_url="https://www.mintscan.io/cosmos",
-        coin_type=118,
-    ),
+    ("cosmos", "cosmoshub-4", "Cosmos Hub", "ATOM",
+     ChainType.CUSTOM, SigningCurve.ECDSA_SECP256K1, AddressFormat.BECH32, 6,
+     "WHALE_COSMOS_RPC", "https://cosmos-rpc.publicnode.com:443", "https://www.mintscan.io/cosmos",
+     False, False, False, True, 118),
     
     # --- Polkadot Ecosystem ---
-    "polkadot": ChainConfig(
-        chain_id="polkadot",
-        name="Polkadot",
-        symbol="DOT",
-        chain_type=ChainType.WASM,
-        signing_curve=SigningCurve.EDDSA_ED25519,
-        address_format=AddressFormat.SS58,
-        decimals=10,
-        rpc_env_var="WHALE_POLKADOT_RPC",
-        default_rpc="wss://rpc.polkadot.io",
-        explorer_url="https://polkadot.subscan.io",
-        coin_type=354,
-    ),
+    ("polkadot", "polkadot", "Polkadot", "DOT",
+     ChainType.WASM, SigningCurve.EDDSA_ED25519, AddressFormat.SS58, 10,
+     "WHALE_POLKADOT_RPC", "wss://rpc.polkadot.io", "https://polkadot.subscan.io",
+     False, False, False, True, 354),
     
     # --- Cardano ---
-    "cardano": ChainConfig(
-        chain_id="cardano",
-        name="Cardano",
-        symbol="ADA",
-        chain_type=ChainType.CUSTOM,
-        signing_curve=SigningCurve.EDDSA_ED25519,
-        address_format=AddressFormat.BECH32,
-        decimals=6,
-        rpc_env_var="WHALE_CARDANO_RPC",
-        default_rpc="https://cardano-mainnet.blockfrost.io/api/v0",
-        explorer_url="https://cardanoscan.io",
-        coin_type=1815,
-    ),
+    ("cardano", "cardano", "Cardano", "ADA",
+     ChainType.CUSTOM, SigningCurve.EDDSA_ED25519, AddressFormat.BECH32, 6,
+     "WHALE_CARDANO_RPC", "https://cardano-mainnet.blockfrost.io/api/v0", "https://cardanoscan.io",
+     False, False, False, True, 1815),
     
     # --- TRON ---
-    "tron": ChainConfig(
-        chain_id="tron",
-        name="TRON",
-        symbol="TRX",
-        chain_type=ChainType.CUSTOM,
-        signing_curve=SigningCurve.ECDSA_SECP256K1,
-        address_format=AddressFormat.BASE58,
-        decimals=6,
-        rpc_env_var="WHALE_TRON_RPC",
-        default_rpc="https://api.trongrid.io",
-        explorer_url="https://tronscan.org",
-        coin_type=195,
-    ),
+    ("tron", "tron", "TRON", "TRX",
+     ChainType.CUSTOM, SigningCurve.ECDSA_SECP256K1, AddressFormat.BASE58, 6,
+     "WHALE_TRON_RPC", "https://api.trongrid.io", "https://tronscan.org",
+     False, False, False, True, 195),
     
     # --- TON ---
-    "ton": ChainConfig(
-        chain_id="ton",
-        name="TON",
-        symbol="TON",
-        chain_type=ChainType.CUSTOM,
-        signing_curve=SigningCurve.EDDSA_ED25519,
-        address_format=AddressFormat.BASE58,
-        decimals=9,
-        rpc_env_var="WHALE_TON_RPC",
-        default_rpc="https://toncenter.com/api/v2/jsonRPC",
-        explorer_url="https://tonscan.org",
-        coin_type=607,
-    ),
+    ("ton", "ton", "TON", "TON",
+     ChainType.CUSTOM, SigningCurve.EDDSA_ED25519, AddressFormat.BASE58, 9,
+     "WHALE_TON_RPC", "https://toncenter.com/api/v2/jsonRPC", "https://tonscan.org",
+     False, False, False, True, 607),
     
     # --- Near Protocol ---
-    "near": ChainConfig(
-        chain_id="near",
-        name="Near Protocol",
-        symbol="NEAR",
-        chain_type=ChainType.WASM,
-        signing_curve=SigningCurve.EDDSA_ED25519,
-        address_format=AddressFormat.CUSTOM,
-        decimals=24,
-        rpc_env_var="WHALE_NEAR_RPC",
-        default_rpc="https://rpc.mainnet.near.org",
-        explorer_url="https://nearblocks.io",
-        coin_type=397,
-    ),
+    ("near", "near", "Near Protocol", "NEAR",
+     ChainType.WASM, SigningCurve.EDDSA_ED25519, AddressFormat.CUSTOM, 24,
+     "WHALE_NEAR_RPC", "https://rpc.mainnet.near.org", "https://nearblocks.io",
+     False, False, False, True, 397),
+)
+
+CHAIN_REGISTRY: dict[str, ChainConfig] = {
+    row[0]: ChainConfig(*row[1:]) for row in _CHAIN_ROWS
 }
 
 
@@ -423,10 +256,31 @@ def get_chain_by_id(chain_id: str) -> Optional[ChainConfig]:
 # CHAIN STATISTICS
 # =============================================================================
 
-CHAIN_STATS = {
-    "total_chains": len(CHAIN_REGISTRY),
-    "evm_chains": len(get_evm_chains()),
-    "ecdsa_chains": len(get_chains_by_curve(SigningCurve.ECDSA_SECP256K1)),
-    "eddsa_chains": len(get_chains_by_curve(SigningCurve.EDDSA_ED25519)),
-    "supported_symbols": list(set(c.symbol for c in CHAIN_REGISTRY.values())),
-}
+@lru_cache(maxsize=1)
+def chain_stats() -> MappingProxyType:
+    """
+    Get aggregate statistics about the chain registry.
+    
+    Computed in a single pass on first use and cached, so importing
+    the registry does no extra work for callers that never need stats.
+    The result is shared between callers and is therefore read-only.
+    """
+    evm = ecdsa = eddsa = 0
+    symbols: set[str] = set()
+    
+    for config in CHAIN_REGISTRY.values():
+        if config.chain_type == ChainType.EVM:
+            evm += 1
+        if config.signing_curve == SigningCurve.ECDSA_SECP256K1:
+            ecdsa += 1
+        elif config.signing_curve == SigningCurve.EDDSA_ED25519:
+            eddsa += 1
+        symbols.add(config.symbol)
+    
+    return MappingProxyType({
+        "total_chains": len(CHAIN_REGISTRY),
+        "evm_chains": evm,
+        "ecdsa_chains": ecdsa,
+        "eddsa_chains": eddsa,
+        "supported_symbols": tuple(sorted(symbols)),
+    })
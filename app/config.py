@@ -5,7 +5,7 @@ Centralized configuration using Pydantic Settings for type-safe
 environment variable management with validation.
 """
 
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from typing import Literal
 
 from pydantic import Field, SecretStr, field_validator
@@ -41,16 +41,19 @@ class Settings(BaseSettings):
     db_name: str = "whale_wallet"
     db_user: str = "whale_api"
     db_password: SecretStr = Field(...)
+    db_pool_size: int = Field(default=20, ge=1)
+    db_max_overflow: int = Field(default=40, ge=0)
+    db_pool_recycle: int = Field(default=1800, ge=-1)
     
-    @property
+    @cached_property
     def database_url(self) -> str:
-        """Construct async database URL for SQLAlchemy."""
+        """Construct async database URL for SQLAlchemy (built once)."""
         password = self.db_password.get_secret_value()
         return f"postgresql+asyncpg://{self.db_user}:{password}@{self.db_host}:{self.db_port}/{self.db_name}"
     
-    @property
+    @cached_property
     def database_url_sync(self) -> str:
-        """Construct sync database URL for Alembic migrations."""
+        """Construct sync database URL for Alembic migrations (built once)."""
         password = self.db_password.get_secret_value()
         return f"postgresql://{self.db_user}:{password}@{self.db_host}:{self.db_port}/{self.db_name}"
     
@@ -169,7 +172,7 @@ class Settings(BaseSettings):
         }
 
 
-@lru_cache
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get cached settings instance.
@@ -6,18 +6,62 @@ resources that need to be initialized at startup and
 cleaned up at shutdown.
 """
 
+import asyncio
 from typing import Callable
 
 import structlog
 from fastapi import FastAPI
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 import redis.asyncio as redis
 
-from app.config import get_settings
+from app.config import Settings, get_settings
 
 logger = structlog.get_logger(__name__)
 
 
+async def _init_db(app: FastAPI, settings: Settings) -> None:
+    """Create the database engine and verify connectivity."""
+    logger.info("Connecting to PostgreSQL", host=settings.db_host)
+    
+    engine = create_async_engine(
+        settings.database_url,
+        echo=settings.debug,
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_pre_ping=True,
+        pool_recycle=settings.db_pool_recycle,
+        pool_use_lifo=True  # Keep hot connections hot
+    )
+    
+    # Store engine in app state for dependency injection
+    app.state.db_engine = engine
+    app.state.db_session_factory = async_sessionmaker(
+        engine,
+        class_=AsyncSession,
+        expire_on_commit=False
+    )
+    
+    # Verify connection (plain connect - no BEGIN/COMMIT for a read)
+    async with engine.connect() as conn:
+        await conn.execute(text("SELECT 1"))
+
+
+async def _init_redis(app: FastAPI, settings: Settings) -> None:
+    """Create the Redis client and verify connectivity."""
+    logger.info("Connecting to Redis", host=settings.redis_host)
+    
+    redis_client = redis.from_url(
+        settings.redis_url,
+        encoding="utf-8",
+        decode_responses=True
+    )
+    app.state.redis = redis_client
+    
+    # Verify connection
+    await redis_client.ping()
+
+
 def create_start_app_handler(app: FastAPI) -> Callable:
     """
     Create the startup event handler.
@@ -32,54 +76,26 @@ def create_start_app_handler(app: FastAPI) -> Callable:
     async def start_app() -> None:
         settings = get_settings()
         
-        # === Database Engine (graceful - don't fail if unavailable) ===
-        try:
-            logger.info("Connecting to PostgreSQL", host=settings.db_host)
-            
-            engine = create_async_engine(
-                settings.database_url,
-                echo=settings.debug,
-                pool_size=5,
-                max_overflow=10,
-                pool_pre_ping=True,
-                pool_recycle=300
-            )
-            
-            # Store engine in app state for dependency injection
-            app.state.db_engine = engine
-            app.state.db_session_factory = async_sessionmaker(
-                engine,
-                class_=AsyncSession,
-                expire_on_commit=False
-            )
-            
-            # Verify connection
-            async with engine.begin() as conn:
-                await conn.execute("SELECT 1")
+        # === Database & Redis (graceful - probed concurrently) ===
+        db_result, redis_result = await asyncio.gather(
+            _init_db(app, settings),
+            _init_redis(app, settings),
+            return_exceptions=True
+        )
+        
+        if isinstance(db_result, BaseException):
+            logger.warning("PostgreSQL connection failed - running without database", error=str(db_result))
+            app.state.db_connected = False
+        else:
             logger.info("PostgreSQL connection established")
             app.state.db_connected = True
-        except Exception as e:
-            logger.warning("PostgreSQL connection failed - running without database", error=str(e))
-            app.state.db_connected = False
         
-        # === Redis Connection (graceful) ===
-        try:
-            logger.info("Connecting to Redis", host=settings.redis_host)
-            
-            redis_client = redis.from_url(
-                settings.redis_url,
-                encoding="utf-8",
-                decode_responses=True
-            )
-            app.state.redis = redis_client
-            
-            # Verify connection
-            await redis_client.ping()
+        if isinstance(redis_result, BaseException):
+            logger.warning("Redis connection failed - running without cache", error=str(redis_result))
+            app.state.redis_connected = False
+        else:
             logger.info("Redis connection established")
             app.state.redis_connected = True
-        except Exception as e:
-            logger.warning("Redis connection failed - running without cache", error=str(e))
-            app.state.redis_connected = False
         
         # === Vector Database (if enabled) ===
         if settings.enable_ai_concierge and settings.vector_db_provider == "pinecone":
@@ -104,6 +120,18 @@ def create_start_app_handler(app: FastAPI) -> Callable:
     return start_app
 
 
+async def _close_redis(app: FastAPI) -> None:
+    """Close the Redis client."""
+    await app.state.redis.close()
+    logger.info("Redis connection closed")
+
+
+async def _close_db(app: FastAPI) -> None:
+    """Dispose of the database connection pool."""
+    await app.state.db_engine.dispose()
+    logger.info("PostgreSQL connection pool closed")
+
+
 def create_stop_app_handler(app: FastAPI) -> Callable:
     """
     Create the shutdown event handler.
@@ -117,15 +145,26 @@ def create_stop_app_handler(app: FastAPI) -> Callable:
     async def stop_app() -> None:
         logger.info("Beginning graceful shutdown")
         
-        # Close Redis connection
+        closers: dict[str, Callable] = {}
+        
+        # Close whatever was created, even if its startup probe failed
         if hasattr(app.state, "redis"):
-            await app.state.redis.close()
-            logger.info("Redis connection closed")
+            closers["redis"] = _close_redis
         
-        # Close database engine
         if hasattr(app.state, "db_engine"):
-            await app.state.db_engine.dispose()
-            logger.info("PostgreSQL connection pool closed")
+            closers["postgres"] = _close_db
+        
+        results = await asyncio.gather(
+            *(close(app) for close in closers.values()),
+            return_exceptions=True
+        )
+        for resource, result in zip(closers, results):
+            if isinstance(result, BaseException):
+                logger.error(
+                    "Error during shutdown",
+                    resource=resource,
+                    error=str(result)
+                )
         
         logger.info("Application shutdown complete")
     
@@ -9,16 +9,48 @@ Provides:
 
 import time
 import uuid
-from typing import Callable
+from typing import Any, Callable
 
+import orjson
 import structlog
+from structlog.contextvars import bind_contextvars, clear_contextvars
 from starlette.middleware.base import BaseHTTPMiddleware
 from starlette.requests import Request
-from starlette.responses import Response, JSONResponse
+from starlette.responses import Response
 
 logger = structlog.get_logger(__name__)
 
 
+class _JSONResponse(Response):
+    """
+    JSON response rendered with orjson.
+    
+    Used for middleware rejections (429/401). FastAPI's ORJSONResponse
+    is deprecated and warns on every instantiation.
+    """
+    media_type = "application/json"
+    
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
+
+
+def get_client_ip(request: Request) -> str:
+    """
+    Get the client IP for a request, resolving it at most once.
+    
+    Reads the raw ASGI scope instead of the Request.client property and
+    stashes the result in the scope state (exposed as request.state.client_ip)
+    for later middleware layers.
+    """
+    state = request.scope.setdefault("state", {})
+    client_ip = state.get("client_ip")
+    if client_ip is None:
+        scope_client = request.scope.get("client")
+        client_ip = scope_client[0] if scope_client else "unknown"
+        state["client_ip"] = client_ip
+    return client_ip
+
+
 class RequestLoggingMiddleware(BaseHTTPMiddleware):
     """
     Log all requests with timing and correlation IDs.
@@ -30,12 +62,12 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         # Generate or extract request ID
         request_id = request.headers.get("X-Request-ID", str(uuid.uuid4()))
         
-        # Bind request context to logger
-        log = logger.bind(
+        # Bind request context for every log call made during this request
+        bind_contextvars(
             request_id=request_id,
             method=request.method,
             path=request.url.path,
-            client_ip=request.client.host if request.client else "unknown"
+            client_ip=get_client_ip(request)
         )
         
         # Time the request
@@ -47,7 +79,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             # Calculate duration
             duration_ms = (time.perf_counter() - start_time) * 1000
             
-            log.info(
+            logger.info(
                 "Request completed",
                 status_code=response.status_code,
                 duration_ms=round(duration_ms, 2)
@@ -60,12 +92,15 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
             
         except Exception as e:
             duration_ms = (time.perf_counter() - start_time) * 1000
-            log.error(
+            logger.error(
                 "Request failed",
                 error=str(e),
                 duration_ms=round(duration_ms, 2)
             )
             raise
+        
+        finally:
+            clear_contextvars()
 
 
 class RateLimitMiddleware(BaseHTTPMiddleware):
@@ -90,7 +125,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         client_id = self._get_client_id(request)
         
         # Check rate limit
-        now = time.time()
+        now = time.monotonic()
         window_start = now - self.window_seconds
         
         # Clean old requests and get recent count
@@ -108,7 +143,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 client_id=client_id,
                 requests=len(self.requests[client_id])
             )
-            return JSONResponse(
+            return _JSONResponse(
                 status_code=429,
                 content={
                     "error": "rate_limit_exceeded",
@@ -127,9 +162,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
         """Get client identifier for rate limiting."""
         # Try to get user ID from auth header (JWT)
         # For now, fall back to IP
-        if request.client:
-            return request.client.host
-        return "unknown"
+        return get_client_ip(request)
 
 
 class AttestationMiddleware(BaseHTTPMiddleware):
@@ -142,16 +175,17 @@ class AttestationMiddleware(BaseHTTPMiddleware):
     Only enabled in production environments.
     """
     
+    # Non-sensitive endpoints that skip attestation
+    EXEMPT_PATHS = (
+        "/health",
+        "/docs",
+        "/openapi.json",
+        "/api/v1/auth/register",  # Allow registration without attestation
+    )
+    
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         # Skip attestation for non-sensitive endpoints
-        exempt_paths = [
-            "/health",
-            "/docs",
-            "/openapi.json",
-            "/api/v1/auth/register",  # Allow registration without attestation
-        ]
-        
-        if any(request.url.path.startswith(p) for p in exempt_paths):
+        if request.url.path.startswith(self.EXEMPT_PATHS):
             return await call_next(request)
         
         # Check for attestation header
@@ -162,7 +196,7 @@ class AttestationMiddleware(BaseHTTPMiddleware):
                 "Missing attestation token",
                 path=request.url.path
             )
-            return JSONResponse(
+            return _JSONResponse(
                 status_code=401,
                 content={
                     "error": "attestation_required",
@@ -180,7 +214,7 @@ class AttestationMiddleware(BaseHTTPMiddleware):
                 "Invalid attestation token",
                 path=request.url.path
             )
-            return JSONResponse(
+            return _JSONResponse(
                 status_code=401,
                 content={
                     "error": "attestation_failed",
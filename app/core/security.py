@@ -6,16 +6,29 @@ Core security functions for encryption, hashing, and secrets management.
 
 import hashlib
 import hmac
+import os
 import secrets
 from base64 import b64decode, b64encode
+from functools import lru_cache, partial
+from hashlib import sha256 as _sha256
 from typing import Any
 
-from cryptography.fernet import Fernet
-from cryptography.hazmat.primitives import hashes
-from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from eth_hash.auto import keccak
 
 from app.config import get_settings
 
+# AES-GCM nonce size in bytes (96 bits, as recommended by NIST SP 800-38D)
+_NONCE_SIZE = 12
+
+# PBKDF2-SHA256 rounds for duress PINs (OWASP recommended minimum).
+# hashlib.pbkdf2_hmac runs these in OpenSSL, which uses SHA-NI when the
+# CPU has it - keep OPENSSL_ia32cap unset in deployments (see README).
+_DURESS_PIN_ITERATIONS = 600_000
+
+# RIPEMD-160 has no named hashlib constructor; bind the lookup once
+_ripemd160 = partial(hashlib.new, "ripemd160")
+
 
 def generate_secure_token(length: int = 32) -> str:
     """Generate a cryptographically secure random token."""
@@ -32,15 +45,14 @@ def generate_duress_pin_hash(pin: str, salt: bytes | None = None) -> tuple[str,
     if salt is None:
         salt = secrets.token_bytes(32)
     
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=600_000  # OWASP recommended minimum
+    key = hashlib.pbkdf2_hmac(
+        "sha256",
+        pin.encode(),
+        salt,
+        _DURESS_PIN_ITERATIONS,
+        dklen=32
     )
     
-    key = kdf.derive(pin.encode())
-    
     return b64encode(key).decode(), b64encode(salt).decode()
 
 
@@ -52,26 +64,47 @@ def verify_duress_pin(
     """Verify a duress PIN against stored hash."""
     salt = b64decode(stored_salt)
     
-    kdf = PBKDF2HMAC(
-        algorithm=hashes.SHA256(),
-        length=32,
-        salt=salt,
-        iterations=600_000
-    )
-    
     try:
-        computed_hash = b64encode(kdf.derive(pin.encode())).decode()
+        computed = hashlib.pbkdf2_hmac(
+            "sha256",
+            pin.encode(),
+            salt,
+            _DURESS_PIN_ITERATIONS,
+            dklen=32
+        )
+        computed_hash = b64encode(computed).decode()
         return hmac.compare_digest(computed_hash, stored_hash)
     except Exception:
         return False
 
 
+@lru_cache(maxsize=4)
+def _derive_key(master_key: bytes) -> bytes:
+    """
+    Derive a raw 256-bit AES key from master key.
+    
+    The KDF is deterministic for a fixed salt, so the result is cached
+    to pay the 100k PBKDF2 rounds once per master key, not per instance.
+    """
+    return hashlib.pbkdf2_hmac(
+        "sha256",
+        master_key,
+        b"whale-wallet-encryption-v1",  # Fixed salt is OK for key derivation
+        100_000,
+        dklen=32
+    )
+
+
 class EncryptionService:
     """
     Encryption service for sensitive data at rest.
     
-    Uses Fernet (AES-128-CBC) for symmetric encryption.
+    Uses AES-256-GCM for authenticated symmetric encryption
+    (hardware-accelerated via AES-NI / ARMv8 crypto where available).
     Keys are derived from the master encryption key.
+    
+    Ciphertext layout: nonce[12] || ciphertext || tag[16], base64-encoded
+    by the string API and left raw by the *_bytes API.
     """
     
     def __init__(self, master_key: str | None = None):
@@ -80,31 +113,33 @@ class EncryptionService:
             settings = get_settings()
             master_key = settings.encryption_key.get_secret_value()
         
-        # Derive a Fernet key from the master key
-        self._key = self._derive_key(master_key.encode())
-        self._fernet = Fernet(self._key)
-    
-    def _derive_key(self, master_key: bytes) -> bytes:
-        """Derive a Fernet-compatible key from master key."""
-        kdf = PBKDF2HMAC(
-            algorithm=hashes.SHA256(),
-            length=32,
-            salt=b"whale-wallet-encryption-v1",  # Fixed salt is OK for key derivation
-            iterations=100_000
+        # Derive an AES key from the master key
+        self._key = _derive_key(master_key.encode())
+        self._aead = AESGCM(self._key)
+    
+    def encrypt_bytes(self, plaintext: bytes) -> bytes:
+        """
+        Encrypt raw bytes and return raw ciphertext.
+        
+        Use for internal storage (e.g. bytea columns) where the
+        base64 text encoding is pure overhead.
+        """
+        nonce = os.urandom(_NONCE_SIZE)
+        return nonce + self._aead.encrypt(nonce, plaintext, None)
+    
+    def decrypt_bytes(self, ciphertext: bytes) -> bytes:
+        """Decrypt raw ciphertext produced by encrypt_bytes."""
+        return self._aead.decrypt(
+            ciphertext[:_NONCE_SIZE], ciphertext[_NONCE_SIZE:], None
         )
-        derived = kdf.derive(master_key)
-        return b64encode(derived)
     
     def encrypt(self, plaintext: str) -> str:
         """Encrypt a string and return base64-encoded ciphertext."""
-        ciphertext = self._fernet.encrypt(plaintext.encode())
-        return b64encode(ciphertext).decode()
+        return b64encode(self.encrypt_bytes(plaintext.encode())).decode()
     
     def decrypt(self, ciphertext: str) -> str:
         """Decrypt base64-encoded ciphertext and return plaintext."""
-        encrypted = b64decode(ciphertext)
-        plaintext = self._fernet.decrypt(encrypted)
-        return plaintext.decode()
+        return self.decrypt_bytes(b64decode(ciphertext)).decode()
     
     def encrypt_dict(self, data: dict) -> str:
         """Encrypt a dictionary as JSON."""
@@ -119,13 +154,29 @@ class EncryptionService:
         return json.loads(json_str)
 
 
-def constant_time_compare(a: str, b: str) -> bool:
+@lru_cache(maxsize=1)
+def get_encryption_service() -> EncryptionService:
+    """
+    Get cached encryption service instance.
+    
+    Uses lru_cache so the service (and its derived key) is built
+    once and reused across the application lifetime.
+    """
+    return EncryptionService()
+
+
+def constant_time_compare(a: bytes | str, b: bytes | str) -> bool:
     """
-    Compare two strings in constant time.
+    Compare two strings or byte strings in constant time.
     
-    Prevents timing attacks on sensitive comparisons.
+    Prevents timing attacks on sensitive comparisons. Bytes (tokens,
+    HMAC digests) are compared as-is; only str arguments are encoded.
     """
-    return hmac.compare_digest(a.encode(), b.encode())
+    if isinstance(a, str):
+        a = a.encode()
+    if isinstance(b, str):
+        b = b.encode()
+    return hmac.compare_digest(a, b)
 
 
 def generate_shard_id() -> str:
@@ -141,16 +192,14 @@ def derive_address_from_pubkey(pubkey: bytes, chain: str) -> str:
     on the specific chain's address derivation.
     """
     if chain == "ethereum":
-        # Keccak-256 hash, take last 20 bytes
-        from hashlib import sha3_256
-        hash_bytes = sha3_256(pubkey).digest()
+        # Keccak-256 hash (not NIST SHA3-256), take last 20 bytes
+        hash_bytes = keccak(pubkey)
         return "0x" + hash_bytes[-20:].hex()
     
     elif chain == "bitcoin":
         # SHA256 -> RIPEMD160 -> Base58Check
-        import hashlib
-        sha = hashlib.sha256(pubkey).digest()
-        ripemd = hashlib.new('ripemd160', sha).digest()
+        sha = _sha256(pubkey).digest()
+        ripemd = _ripemd160(sha).digest()
         return ripemd.hex()  # Simplified - real impl needs Base58Check
     
     elif chain == "solana":
@@ -31,6 +31,7 @@ from app.core.middleware import (
 # Configure structured logging
 structlog.configure(
     processors=[
+        structlog.contextvars.merge_contextvars,
         structlog.stdlib.filter_by_level,
         structlog.stdlib.add_logger_name,
         structlog.stdlib.add_log_level,
@@ -133,6 +134,7 @@ def create_application() -> FastAPI:
     )
     
     # Mobile app attestation (only in production)
+    # Not registered at all when disabled, so no ASGI layer is added
     if settings.attestation_enabled:
         app.add_middleware(AttestationMiddleware)
     
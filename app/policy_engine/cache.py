@@ -0,0 +1,50 @@
+"""
+Policy Engine Caching Helpers
+
+Cache keys for policy configurations and a bounded insert shared by
+the executor's compiled-rule cache and rule pool and the evaluator's
+limits cache.
+"""
+
+import json
+from typing import Any, Hashable
+
+
+def config_key(config: dict) -> Hashable:
+    """
+    Build a hashable key for a rule configuration.
+
+    Uses the config's own values (not just their hash), paired with
+    their types since 1, 1.0 and True compare equal but are different
+    config. Falls back to canonical JSON when the config holds
+    unhashable values.
+    """
+    try:
+        return frozenset((k, type(v), v) for k, v in config.items())
+    except TypeError:
+        return json.dumps(config, sort_keys=True, default=str)
+
+
+def policies_key(policies: list[dict]) -> Hashable:
+    """Build a cache key for a list of policy configurations."""
+    return tuple(
+        (
+            p.get("rule_type"),
+            p.get("name"),
+            config_key(p.get("config") or {}),
+            p.get("priority", 0),
+            p.get("is_active", True),
+        )
+        for p in policies
+    )
+
+
+def bounded_put(cache: dict, key: Hashable, value: Any, maxsize: int) -> None:
+    """
+    Insert into a dict-backed cache, evicting the oldest entry when full.
+
+    Dicts preserve insertion order, so the first key is the oldest.
+    """
+    if len(cache) >= maxsize:
+        del cache[next(iter(cache))]
+    cache[key] = value
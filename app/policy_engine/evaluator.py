@@ -5,18 +5,31 @@ High-level interface for evaluating policies.
 Used by the API layer to check transactions.
 """
 
+import math
 from decimal import Decimal
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Hashable
 
 import structlog
 
-from app.policy_engine.executor import PolicyExecutor, TransactionContext, ExecutionResult
+from app.policy_engine.cache import bounded_put, policies_key
+from app.policy_engine.executor import (
+    PolicyExecutor,
+    TransactionContext,
+    ExecutionResult,
+)
+from app.policy_engine.rules.base import to_decimal
 from app.policy_engine.rules.velocity import VelocityRule
 from app.policy_engine.rules.whitelist import WhitelistRule
 from app.policy_engine.rules.timelock import TimelockRule
 
 logger = structlog.get_logger(__name__)
 
+# Maximum number of distinct policy configurations with cached limits
+_LIMITS_CACHE_SIZE = 1024
+
+_ZERO = Decimal("0")
+
 
 class PolicyEvaluator:
     """
@@ -34,6 +47,9 @@ class PolicyEvaluator:
         self.executor.register_rule("velocity", VelocityRule)
         self.executor.register_rule("whitelist", WhitelistRule)
         self.executor.register_rule("timelock", TimelockRule)
+        
+        # Effective limits keyed by policy configuration
+        self._limits_cache: dict[Hashable, dict] = {}
     
     async def evaluate_transaction(
         self,
@@ -43,7 +59,7 @@ class PolicyEvaluator:
         chain: str,
         to_address: str,
         value_usd: Decimal,
-        daily_outflow_usd: Decimal = Decimal("0"),
+        daily_outflow_usd: Decimal = _ZERO,
         is_new_address: bool = True,
         is_contract_call: bool = False,
         contract_verified: bool = False,
@@ -72,18 +88,24 @@ class PolicyEvaluator:
         # Load rules from policy config
         self.executor.load_rules_from_config(policies)
         
+        # Normalize amounts once at the boundary so rules only ever
+        # compare Decimal to Decimal (limits must be exact, and mixing
+        # float into Decimal arithmetic raises)
+        value_usd = to_decimal(value_usd)
+        daily_outflow_usd = to_decimal(daily_outflow_usd)
+        
         # Build transaction context
         context = TransactionContext(
             chain=chain,
             to_address=to_address,
-            value_native=Decimal("0"),  # Would be calculated from chain
+            value_native=_ZERO,  # Would be calculated from chain
             value_usd=value_usd,
             user_id=user_id,
             user_tier=user_tier,
             daily_outflow_usd=daily_outflow_usd,
             is_new_address=is_new_address,
             address_in_whitelist=not is_new_address,  # Simplified
-            current_time=datetime.utcnow(),
+            current_time=datetime.now(timezone.utc),
             duress_mode_active=duress_mode,
             is_contract_call=is_contract_call,
             contract_verified=contract_verified
@@ -109,56 +131,66 @@ class PolicyEvaluator:
         """
         Get the effective limits from all policies.
         
-        Useful for displaying limits in the UI.
+        Useful for displaying limits in the UI. The reduction is computed
+        once per policy configuration and served from cache afterwards.
         """
-        limits = {
-            "daily_limit_usd": float("inf"),
-            "per_tx_limit_usd": float("inf"),
-            "requires_2fa_above_usd": float("inf"),
-            "blocked_hours": [],
-            "whitelist_mode": None
+        key = policies_key(policies)
+        limits = self._limits_cache.get(key)
+        if limits is None:
+            limits = _reduce_limits(policies)
+            bounded_put(self._limits_cache, key, limits, _LIMITS_CACHE_SIZE)
+        
+        # Hand out copies so callers cannot mutate the cached entry
+        return {
+            **limits,
+            "blocked_hours": [dict(b) for b in limits["blocked_hours"]]
         }
+
+
+def _reduce_limits(policies: list[dict]) -> dict:
+    """Reduce policy configurations to the effective (minimum) limits."""
+    daily = per_tx = require_2fa_above = math.inf
+    blocked_hours = []
+    whitelist_mode = None
+    
+    for policy in policies:
+        if not policy.get("is_active", True):
+            continue
         
-        for policy in policies:
-            if not policy.get("is_active", True):
-                continue
-            
-            config = policy.get("config", {})
-            rule_type = policy.get("rule_type")
-            
-            if rule_type == "velocity":
-                if config.get("max_daily_usd"):
-                    limits["daily_limit_usd"] = min(
-                        limits["daily_limit_usd"],
-                        config["max_daily_usd"]
-                    )
-                if config.get("max_per_tx_usd"):
-                    limits["per_tx_limit_usd"] = min(
-                        limits["per_tx_limit_usd"],
-                        config["max_per_tx_usd"]
-                    )
-                if config.get("require_2fa_above_usd"):
-                    limits["requires_2fa_above_usd"] = min(
-                        limits["requires_2fa_above_usd"],
-                        config["require_2fa_above_usd"]
-                    )
-            
-            elif rule_type == "timelock":
-                start = config.get("block_start_hour")
-                end = config.get("block_end_hour")
-                if start is not None and end is not None:
-                    limits["blocked_hours"].append({
-                        "start": start,
-                        "end": end,
-                        "timezone": config.get("timezone", "UTC")
-                    })
-            
-            elif rule_type == "whitelist":
-                limits["whitelist_mode"] = config.get("mode")
+        config = policy.get("config") or {}
+        rule_type = policy.get("rule_type")
         
-        # Convert inf to None for JSON serialization
-        for key in ["daily_limit_usd", "per_tx_limit_usd", "requires_2fa_above_usd"]:
-            if limits[key] == float("inf"):
-                limits[key] = None
+        if rule_type == "velocity":
+            value = config.get("max_daily_usd")
+            if value and value < daily:
+                daily = value
+            value = config.get("max_per_tx_usd")
+            if value and value < per_tx:
+                per_tx = value
+            value = config.get("require_2fa_above_usd")
+            if value and value < require_2fa_above:
+                require_2fa_above = value
         
-        return limits
+        elif rule_type == "timelock":
+            start = config.get("block_start_hour")
+            end = config.get("block_end_hour")
+            if start is not None and end is not None:
+                blocked_hours.append({
+                    "start": start,
+                    "end": end,
+                    "timezone": config.get("timezone", "UTC")
+                })
+        
+        elif rule_type == "whitelist":
+            whitelist_mode = config.get("mode")
+    
+    # Convert inf to None for JSON serialization
+    return {
+        "daily_limit_usd": None if daily == math.inf else daily,
+        "per_tx_limit_usd": None if per_tx == math.inf else per_tx,
+        "requires_2fa_above_usd": (
+            None if require_2fa_above == math.inf else require_2fa_above
+        ),
+        "blocked_hours": blocked_hours,
+        "whitelist_mode": whitelist_mode
+    }
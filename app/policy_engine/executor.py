@@ -8,15 +8,24 @@ This code is designed to run inside a TEE (Trusted Execution Environment)
 where it cannot be tampered with, even by the wallet administrators.
 """
 
+import asyncio
+import time
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from enum import Enum
-from typing import Protocol, Any
+from typing import Protocol, Any, Hashable, Sequence
 
 import structlog
 
-from app.policy_engine.rules.base import PolicyRule, PolicyContext, PolicyDecision
+from app.policy_engine.cache import bounded_put, config_key, policies_key
+from app.policy_engine.rules.base import (
+    PolicyRule,
+    PolicyContext,
+    PolicyDecision,
+    debug_enabled,
+    info_enabled,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -30,7 +39,39 @@ class DecisionType(str, Enum):
     WARN = "warn"
 
 
-@dataclass
+# Integer severities used while aggregating (lower = more restrictive).
+# DecisionType stays the serialization boundary; ints keep the hot loop
+# free of Enum equality and list-membership checks.
+_SEV_BLOCK = 0
+_SEV_DELAY = 1
+_SEV_REQUIRE_2FA = 2
+_SEV_WARN = 3
+_SEV_ALLOW = 4
+
+_SEVERITY: dict[DecisionType, int] = {
+    DecisionType.BLOCK: _SEV_BLOCK,
+    DecisionType.DELAY: _SEV_DELAY,
+    DecisionType.REQUIRE_2FA: _SEV_REQUIRE_2FA,
+    DecisionType.WARN: _SEV_WARN,
+    DecisionType.ALLOW: _SEV_ALLOW,
+}
+_DECISION_BY_SEVERITY: tuple[DecisionType, ...] = tuple(
+    sorted(_SEVERITY, key=_SEVERITY.__getitem__)
+)
+
+
+def _severity_of(decision: PolicyDecision) -> int:
+    """Map a single rule decision to its severity."""
+    return (
+        _SEV_BLOCK if not decision.allowed
+        else _SEV_DELAY if decision.delay_seconds
+        else _SEV_REQUIRE_2FA if decision.require_2fa
+        else _SEV_WARN if decision.warnings
+        else _SEV_ALLOW
+    )
+
+
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of policy execution."""
     decision: DecisionType
@@ -51,7 +92,7 @@ class ExecutionResult:
             self.delay_seconds = 86400  # Default 24 hours
 
 
-@dataclass
+@dataclass(slots=True)
 class TransactionContext:
     """
     Context about the transaction being evaluated.
@@ -74,8 +115,9 @@ class TransactionContext:
     is_new_address: bool = True
     address_in_whitelist: bool = False
     
-    # Environment
-    current_time: datetime = field(default_factory=datetime.utcnow)
+    # Environment (callers pass the request's timestamp; the executor
+    # fills in "now" once per execution if it is missing)
+    current_time: datetime | None = None
     user_timezone: str = "UTC"
     
     # Security flags
@@ -88,6 +130,13 @@ class TransactionContext:
     function_name: str | None = None
 
 
+# Maximum number of distinct policy configurations kept compiled
+_COMPILED_CACHE_SIZE = 1024
+
+# Maximum number of distinct rule instances kept for reuse
+_RULE_POOL_SIZE = 4096
+
+
 class PolicyExecutor:
     """
     Executes policies against transactions.
@@ -95,23 +144,47 @@ class PolicyExecutor:
     The executor:
     1. Loads all active policies for a user
     2. Sorts them by priority (highest first)
-    3. Evaluates each rule in order
+    3. Evaluates each rule in order, stopping at the first BLOCK
+       (unless strict_audit is set)
     4. Aggregates decisions (most restrictive wins)
     5. Returns final decision with audit trail
     """
     
-    def __init__(self, rules: list[PolicyRule] | None = None):
+    def __init__(
+        self,
+        rules: list[PolicyRule] | None = None,
+        strict_audit: bool = False,
+        concurrent: bool = False
+    ):
         """
         Initialize executor with optional rules.
         
         In production, rules are loaded from the database.
+        
+        Args:
+            rules: Initial rules to evaluate
+            strict_audit: Evaluate every rule even after a BLOCK, for a
+                full audit trail
+            concurrent: Run rule evaluations together with asyncio.gather.
+                Only worth it for rules that await I/O; results are still
+                applied in priority order
         """
-        self.rules: list[PolicyRule] = rules or []
+        self.rules: Sequence[PolicyRule] = rules or []
+        self.strict_audit = strict_audit
+        self.concurrent = concurrent
         self._rule_registry: dict[str, type[PolicyRule]] = {}
+        
+        # Compiled, priority-sorted rule tuples keyed by policy config
+        self._compiled_cache: dict[Hashable, tuple[PolicyRule, ...]] = {}
+        
+        # Stateless rule instances shared across identical policies
+        self._rule_pool: dict[tuple, PolicyRule] = {}
     
     def register_rule(self, rule_type: str, rule_class: type[PolicyRule]) -> None:
         """Register a rule type for dynamic loading."""
         self._rule_registry[rule_type] = rule_class
+        self._compiled_cache.clear()
+        self._rule_pool.clear()
         logger.debug("Registered policy rule", rule_type=rule_type)
     
     def load_rules_from_config(self, policies: list[dict]) -> None:
@@ -123,8 +196,17 @@ class PolicyExecutor:
         - config: dict
         - priority: int
         - is_active: bool
+        
+        Compiled rule lists are cached per policy configuration, so
+        repeated loads of unchanged policies are a single dict lookup.
         """
-        self.rules = []
+        key = policies_key(policies)
+        cached = self._compiled_cache.get(key)
+        if cached is not None:
+            self.rules = cached
+            return
+        
+        rules: list[PolicyRule] = []
         
         for policy in policies:
             if not policy.get("is_active", True):
@@ -136,15 +218,23 @@ class PolicyExecutor:
                 continue
             
             rule_class = self._rule_registry[rule_type]
-            rule = rule_class(
-                name=policy.get("name", rule_type),
-                config=policy.get("config", {}),
-                priority=policy.get("priority", 0)
-            )
-            self.rules.append(rule)
+            name = policy.get("name", rule_type)
+            config = policy.get("config", {})
+            priority = policy.get("priority", 0)
+            
+            # Rules are stateless, so identical policies share one instance
+            pool_key = (rule_class, name, config_key(config or {}), priority)
+            rule = self._rule_pool.get(pool_key)
+            if rule is None:
+                rule = rule_class(name=name, config=config, priority=priority)
+                bounded_put(self._rule_pool, pool_key, rule, _RULE_POOL_SIZE)
+            rules.append(rule)
         
         # Sort by priority (highest first)
-        self.rules.sort(key=lambda r: r.priority, reverse=True)
+        rules.sort(key=lambda r: r.priority, reverse=True)
+        self.rules = tuple(rules)
+        
+        bounded_put(self._compiled_cache, key, self.rules, _COMPILED_CACHE_SIZE)
         
         logger.info("Loaded policy rules", count=len(self.rules))
     
@@ -154,15 +244,17 @@ class PolicyExecutor:
         
         Returns the most restrictive decision from all rules.
         """
-        start_time = datetime.utcnow()
+        t0 = time.perf_counter_ns()
         
-        logger.info(
-            "Executing policies",
-            user_id=tx.user_id,
-            chain=tx.chain,
-            value_usd=float(tx.value_usd),
-            rules_count=len(self.rules)
-        )
+        log_info = info_enabled()
+        if log_info:
+            logger.info(
+                "Executing policies",
+                user_id=tx.user_id,
+                chain=tx.chain,
+                value_usd=float(tx.value_usd),
+                rules_count=len(self.rules)
+            )
         
         # Handle duress mode specially
         if tx.duress_mode_active:
@@ -175,23 +267,53 @@ class PolicyExecutor:
         # Collect decisions from all rules
         decisions: list[tuple[PolicyRule, PolicyDecision]] = []
         
-        for rule in self.rules:
+        # The context is identical for every rule - build it once
+        context = PolicyContext(
+            transaction=tx,
+            user_tier=tx.user_tier,
+            current_time=tx.current_time or datetime.now(timezone.utc)
+        )
+        
+        # Bind the per-execution invariants once; per-rule events only
+        # carry what changes between rules
+        debug_log = (
+            logger.bind(user_id=tx.user_id, chain=tx.chain)
+            if debug_enabled()
+            else None
+        )
+        
+        # In concurrent mode every rule runs up front; the loop below then
+        # replays the outcomes in priority order, so short-circuiting and
+        # fail-closed handling are the same as in sequential mode
+        outcomes = None
+        if self.concurrent and len(self.rules) > 1:
+            outcomes = await asyncio.gather(
+                *(rule.evaluate(context) for rule in self.rules),
+                return_exceptions=True
+            )
+        
+        for i, rule in enumerate(self.rules):
             try:
-                context = PolicyContext(
-                    transaction=tx,
-                    user_tier=tx.user_tier,
-                    current_time=tx.current_time
-                )
+                if outcomes is None:
+                    decision = await rule.evaluate(context)
+                else:
+                    decision = outcomes[i]
+                    if isinstance(decision, BaseException):
+                        raise decision
                 
-                decision = await rule.evaluate(context)
                 decisions.append((rule, decision))
                 
-                logger.debug(
-                    "Rule evaluated",
-                    rule=rule.name,
-                    allowed=decision.allowed,
-                    warnings=decision.warnings
-                )
+                if debug_log is not None:
+                    debug_log.debug(
+                        "Rule evaluated",
+                        rule=rule.name,
+                        allowed=decision.allowed
+                    )
+                
+                # BLOCK is the most restrictive outcome; later (lower
+                # priority) rules cannot change it
+                if not decision.allowed and not self.strict_audit:
+                    break
                 
             except Exception as e:
                 logger.error(
@@ -210,16 +332,15 @@ class PolicyExecutor:
         result = self._aggregate_decisions(decisions)
         
         # Calculate execution time
-        result.evaluation_time_ms = (
-            datetime.utcnow() - start_time
-        ).total_seconds() * 1000
+        result.evaluation_time_ms = (time.perf_counter_ns() - t0) / 1_000_000
         
-        logger.info(
-            "Policy execution complete",
-            decision=result.decision.value,
-            blocking_rule=result.blocking_rule,
-            eval_time_ms=result.evaluation_time_ms
-        )
+        if log_info:
+            logger.info(
+                "Policy execution complete",
+                decision=result.decision.value,
+                blocking_rule=result.blocking_rule,
+                eval_time_ms=result.evaluation_time_ms
+            )
         
         return result
     
@@ -237,9 +358,10 @@ class PolicyExecutor:
         4. WARN
         5. ALLOW
         """
-        final_decision = DecisionType.ALLOW
-        blocking_rule = None
+        severity = _SEV_ALLOW
+        first_rule_at: list[str | None] = [None] * len(_DECISION_BY_SEVERITY)
         delay_seconds = None
+        delay_rule = None
         all_warnings = []
         all_actions = []
         rules_evaluated = []
@@ -249,36 +371,35 @@ class PolicyExecutor:
             all_warnings.extend(decision.warnings)
             all_actions.extend(decision.required_actions)
             
-            if not decision.allowed:
-                # This rule blocks the transaction
-                if final_decision != DecisionType.BLOCK:
-                    final_decision = DecisionType.BLOCK
-                    blocking_rule = rule.name
-            
-            elif decision.delay_seconds:
-                # This rule requires a delay
-                if final_decision not in [DecisionType.BLOCK]:
-                    final_decision = DecisionType.DELAY
-                    if delay_seconds is None or decision.delay_seconds > delay_seconds:
-                        delay_seconds = decision.delay_seconds
-                        blocking_rule = rule.name
+            rule_severity = _severity_of(decision)
+            severity = min(severity, rule_severity)
             
-            elif decision.require_2fa:
-                # This rule requires 2FA
-                if final_decision not in [DecisionType.BLOCK, DecisionType.DELAY]:
-                    final_decision = DecisionType.REQUIRE_2FA
-                    all_actions.append("2fa_required")
+            if first_rule_at[rule_severity] is None:
+                first_rule_at[rule_severity] = rule.name
             
-            elif decision.warnings:
-                # This rule has warnings but allows
-                if final_decision == DecisionType.ALLOW:
-                    final_decision = DecisionType.WARN
+            # The longest delay wins among delaying rules
+            if rule_severity == _SEV_DELAY and (
+                delay_seconds is None or decision.delay_seconds > delay_seconds
+            ):
+                delay_seconds = decision.delay_seconds
+                delay_rule = rule.name
+        
+        if severity == _SEV_BLOCK:
+            blocking_rule = first_rule_at[_SEV_BLOCK]
+            delay_seconds = None
+        elif severity == _SEV_DELAY:
+            blocking_rule = delay_rule
+        else:
+            blocking_rule = None
+        
+        if severity == _SEV_REQUIRE_2FA:
+            all_actions.append("2fa_required")
         
         return ExecutionResult(
-            decision=final_decision,
+            decision=_DECISION_BY_SEVERITY[severity],
             blocking_rule=blocking_rule,
             delay_seconds=delay_seconds,
-            warnings=list(set(all_warnings)),  # Dedupe
-            required_actions=list(set(all_actions)),
+            warnings=list(dict.fromkeys(all_warnings)),  # Dedupe, keep order
+            required_actions=list(dict.fromkeys(all_actions)),
             rules_evaluated=rules_evaluated
         )
@@ -5,22 +5,53 @@ All policy rules inherit from PolicyRule and implement
 the evaluate() method.
 """
 
+import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from datetime import datetime
 from decimal import Decimal
-from typing import Any, TYPE_CHECKING
+from typing import Any, Sequence, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from app.policy_engine.executor import TransactionContext
 
+# stdlib logger consulted by structlog's filter_by_level; the rule and
+# executor loggers are its children, so its effective level gates them
+_level_logger = logging.getLogger("app.policy_engine")
 
-@dataclass
+
+def info_enabled() -> bool:
+    """Whether policy-engine INFO events would be emitted."""
+    return _level_logger.isEnabledFor(logging.INFO)
+
+
+def debug_enabled() -> bool:
+    """Whether policy-engine DEBUG events would be emitted."""
+    return _level_logger.isEnabledFor(logging.DEBUG)
+
+
+def to_decimal(value: Any) -> Decimal:
+    """
+    Convert a numeric value to Decimal, skipping work when possible.
+    
+    Decimals pass through and ints convert exactly; only other types
+    (floats, strings) take the slower str() round-trip. Booleans are not
+    treated as ints, so they fail conversion as they always have.
+    """
+    if isinstance(value, Decimal):
+        return value
+    if type(value) is int:
+        return Decimal(value)
+    return Decimal(str(value))
+
+
+@dataclass(slots=True, frozen=True)
 class PolicyContext:
     """
     Context passed to policy rules during evaluation.
     
-    Contains all information needed to make a decision.
+    Contains all information needed to make a decision. The executor
+    shares one context across all rules, so it is read-only.
     """
     transaction: "TransactionContext"
     user_tier: str
@@ -31,12 +62,13 @@ class PolicyContext:
     whitelist: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PolicyDecision:
     """
     Decision returned by a policy rule.
     
-    Multiple decisions are aggregated by the executor.
+    Multiple decisions are aggregated by the executor. Decisions are
+    immutable so rules can share and cache them across requests.
     """
     # Core decision
     allowed: bool = True
@@ -46,16 +78,22 @@ class PolicyDecision:
     delay_seconds: int | None = None
     
     # User feedback
-    warnings: list[str] = field(default_factory=list)
-    required_actions: list[str] = field(default_factory=list)
+    warnings: tuple[str, ...] = ()
+    required_actions: tuple[str, ...] = ()
     
     # Reason for decision (for audit)
     reason: str = ""
     
     @classmethod
-    def allow(cls, warnings: list[str] | None = None) -> "PolicyDecision":
-        """Factory for allow decision."""
-        return cls(allowed=True, warnings=warnings or [])
+    def allow(cls, warnings: Sequence[str] | None = None) -> "PolicyDecision":
+        """
+        Factory for allow decision.
+        
+        Plain allows (no warnings) share one instance.
+        """
+        if not warnings:
+            return _ALLOW
+        return cls(allowed=True, warnings=tuple(warnings))
     
     @classmethod
     def block(cls, reason: str) -> "PolicyDecision":
@@ -73,10 +111,14 @@ class PolicyDecision:
         return cls(
             allowed=True,
             require_2fa=True,
-            required_actions=[action]
+            required_actions=(action,)
         )
 
 
+# Shared plain-allow decision
+_ALLOW = PolicyDecision(allowed=True)
+
+
 class PolicyRule(ABC):
     """
     Base class for all policy rules.
@@ -102,6 +144,33 @@ class PolicyRule(ABC):
         self.name = name
         self.config = config
         self.priority = priority
+        
+        # Parse the config once here instead of on every evaluate().
+        # Errors are kept and re-raised by _check_config at evaluation
+        # time so that invalid rules fail closed rather than crash loading.
+        self.config_error: Exception | None = None
+        try:
+            self._compile_config()
+        except Exception as e:
+            self.config_error = e
+    
+    def _compile_config(self) -> None:
+        """
+        Pre-parse self.config into attributes used by evaluate().
+        
+        Override in subclasses; the default does nothing.
+        """
+    
+    def _check_config(self) -> None:
+        """
+        Re-raise any error captured by _compile_config.
+        
+        Subclasses call this before using compiled attributes. The
+        traceback is reset on every raise so that a long-lived (pooled)
+        rule does not accumulate frames from past evaluations.
+        """
+        if self.config_error is not None:
+            raise self.config_error.with_traceback(None)
     
     @abstractmethod
     async def evaluate(self, context: PolicyContext) -> PolicyDecision:
@@ -8,14 +8,49 @@ Restricts transactions based on time:
 """
 
 from datetime import datetime, time
+from functools import lru_cache
 from zoneinfo import ZoneInfo
 
 import structlog
 
-from app.policy_engine.rules.base import PolicyRule, PolicyContext, PolicyDecision
+from app.policy_engine.rules.base import (
+    PolicyRule,
+    PolicyContext,
+    PolicyDecision,
+    info_enabled,
+)
 
 logger = structlog.get_logger(__name__)
 
+_DAY_NAMES = (
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
+)
+
+
+@lru_cache(maxsize=256)
+def _get_zone(name: str) -> ZoneInfo:
+    """
+    Get a ZoneInfo instance, interned per timezone name.
+    
+    Invalid names raise and are not cached, so callers keep their
+    own try/except handling.
+    """
+    return ZoneInfo(name)
+
+
+def _hour_offset(bucket: int, tz: ZoneInfo) -> int | None:
+    """
+    Get the UTC offset (seconds) in effect for a whole UTC hour.
+    
+    Returns None if the offset changes within the hour (DST transition),
+    in which case callers must fall back to a full conversion.
+    """
+    start = datetime.fromtimestamp(bucket * 3600, tz).utcoffset()
+    end = datetime.fromtimestamp(bucket * 3600 + 3599, tz).utcoffset()
+    if start != end:
+        return None
+    return int(start.total_seconds())
+
 
 class TimelockRule(PolicyRule):
     """
@@ -28,67 +63,122 @@ class TimelockRule(PolicyRule):
     - block_weekends: Block transactions on Saturday/Sunday
     """
     
-    async def evaluate(self, context: PolicyContext) -> PolicyDecision:
-        """Evaluate transaction against time restrictions."""
-        tx = context.transaction
+    def _compile_config(self) -> None:
+        """Read config options and resolve the timezone once."""
+        self._start_hour = self.config.get("block_start_hour")
+        self._end_hour = self.config.get("block_end_hour")
+        self._timezone_str = self.config.get("timezone", "UTC")
+        self._block_weekends = bool(self.config.get("block_weekends", False))
         
-        # Get config
-        start_hour = self.config.get("block_start_hour")
-        end_hour = self.config.get("block_end_hour")
-        timezone_str = self.config.get("timezone", "UTC")
-        block_weekends = self.config.get("block_weekends", False)
+        # Bit h is set when local hour h falls in the blocked period
+        mask = 0
+        if self._start_hour is not None and self._end_hour is not None:
+            for hour in range(24):
+                if self._is_in_blocked_period(hour, self._start_hour, self._end_hour):
+                    mask |= 1 << hour
+        self._blocked_mask = mask
+        self._hour_block_reason = (
+            f"Transactions are blocked between "
+            f"{self._start_hour}:00 and {self._end_hour}:00 ({self._timezone_str}). "
+        )
         
-        # Get current time in user's timezone
         try:
-            tz = ZoneInfo(timezone_str)
-            current = context.current_time.astimezone(tz)
+            self._tz: ZoneInfo | None = _get_zone(self._timezone_str)
         except Exception:
-            logger.warning("Invalid timezone, using UTC", timezone=timezone_str)
-            current = context.current_time
+            logger.warning("Invalid timezone, using UTC", timezone=self._timezone_str)
+            self._tz = None
+        
+        # (utc_hour_bucket, offset_seconds) for the last evaluated hour
+        self._offset_cache: tuple[int | None, int | None] = (None, None)
         
-        current_hour = current.hour
-        current_weekday = current.weekday()  # 0=Monday, 6=Sunday
+        # Decisions depend only on (local hour, weekday): at most 168 entries
+        self._decisions: dict[tuple[int, int], PolicyDecision] = {}
+    
+    async def evaluate(self, context: PolicyContext) -> PolicyDecision:
+        """Evaluate transaction against time restrictions."""
+        self._check_config()
+        
+        # Get current hour and weekday (0=Monday) in user's timezone
+        current_hour, current_weekday = self._local_hour_and_weekday(
+            context.current_time
+        )
+        
+        key = (current_hour, current_weekday)
+        decision = self._decisions.get(key)
+        if decision is None:
+            decision = self._decide(current_hour, current_weekday)
+            self._decisions[key] = decision
+        
+        if not decision.allowed and info_enabled():
+            if self._block_weekends and current_weekday >= 5:
+                logger.info(
+                    "Timelock rule: weekend block",
+                    day=_DAY_NAMES[current_weekday]
+                )
+            else:
+                logger.info(
+                    "Timelock rule: hour block",
+                    current_hour=current_hour,
+                    block_start=self._start_hour,
+                    block_end=self._end_hour
+                )
         
+        return decision
+    
+    def _decide(self, current_hour: int, current_weekday: int) -> PolicyDecision:
+        """Build the decision for a local hour and weekday."""
         # Check weekend block
-        if block_weekends and current_weekday >= 5:  # Saturday or Sunday
-            logger.info(
-                "Timelock rule: weekend block",
-                day=current.strftime("%A")
-            )
+        if self._block_weekends and current_weekday >= 5:  # Saturday or Sunday
             return PolicyDecision.block(
                 reason=f"Transactions are blocked on weekends. "
                        f"Try again on Monday."
             )
         
         # Check hour block
-        if start_hour is not None and end_hour is not None:
-            is_blocked = self._is_in_blocked_period(
-                current_hour, start_hour, end_hour
-            )
+        if (self._blocked_mask >> current_hour) & 1:
+            end_hour = self._end_hour
             
-            if is_blocked:
-                logger.info(
-                    "Timelock rule: hour block",
-                    current_hour=current_hour,
-                    block_start=start_hour,
-                    block_end=end_hour
-                )
-                
-                # Calculate when block ends
-                if end_hour > current_hour:
-                    hours_until = end_hour - current_hour
-                else:
-                    hours_until = (24 - current_hour) + end_hour
-                
-                return PolicyDecision.block(
-                    reason=f"Transactions are blocked between "
-                           f"{start_hour}:00 and {end_hour}:00 ({timezone_str}). "
-                           f"Try again in ~{hours_until} hours."
-                )
+            # Calculate when block ends
+            if end_hour > current_hour:
+                hours_until = end_hour - current_hour
+            else:
+                hours_until = (24 - current_hour) + end_hour
+            
+            return PolicyDecision.block(
+                reason=self._hour_block_reason
+                       + f"Try again in ~{hours_until} hours."
+            )
         
         # All time checks passed
         return PolicyDecision.allow()
     
+    def _local_hour_and_weekday(self, current_time: datetime) -> tuple[int, int]:
+        """
+        Get the local hour and weekday for a point in time.
+        
+        For aware datetimes this is integer arithmetic on the epoch
+        timestamp, using a UTC offset cached per UTC hour.
+        """
+        tz = self._tz
+        if tz is None:
+            return current_time.hour, current_time.weekday()
+        
+        if current_time.tzinfo is not None:
+            ts = current_time.timestamp()
+            bucket = int(ts // 3600)
+            cached_bucket, offset = self._offset_cache
+            if cached_bucket != bucket:
+                offset = _hour_offset(bucket, tz)
+                self._offset_cache = (bucket, offset)
+            
+            if offset is not None:
+                local = ts + offset
+                # 1970-01-01 was a Thursday (weekday 3)
+                return int(local // 3600) % 24, int(local // 86400 + 3) % 7
+        
+        current = current_time.astimezone(tz)
+        return current.hour, current.weekday()
+    
     def _is_in_blocked_period(
         self,
         current: int,
@@ -115,11 +205,11 @@ class TimelockRule(PolicyRule):
         end = self.config.get("block_end_hour")
         
         if start is not None:
-            if not isinstance(start, int) or not 0 <= start <= 23:
+            if type(start) is not int or not 0 <= start <= 23:
                 errors.append("block_start_hour must be 0-23")
         
         if end is not None:
-            if not isinstance(end, int) or not 0 <= end <= 23:
+            if type(end) is not int or not 0 <= end <= 23:
                 errors.append("block_end_hour must be 0-23")
         
         if (start is None) != (end is None):
@@ -128,7 +218,7 @@ class TimelockRule(PolicyRule):
         tz = self.config.get("timezone")
         if tz:
             try:
-                ZoneInfo(tz)
+                _get_zone(tz)
             except Exception:
                 errors.append(f"Invalid timezone: {tz}")
         
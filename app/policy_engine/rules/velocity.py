@@ -8,14 +8,27 @@ Enforces spending limits:
 - Time delays for large amounts
 """
 
+from collections.abc import Iterable
 from decimal import Decimal
+from typing import TYPE_CHECKING
 
 import structlog
 
-from app.policy_engine.rules.base import PolicyRule, PolicyContext, PolicyDecision
+from app.policy_engine.rules.base import (
+    PolicyRule,
+    PolicyContext,
+    PolicyDecision,
+    info_enabled,
+    to_decimal,
+)
+
+if TYPE_CHECKING:
+    from app.policy_engine.executor import TransactionContext
 
 logger = structlog.get_logger(__name__)
 
+_ZERO = Decimal("0")
+
 
 class VelocityRule(PolicyRule):
     """
@@ -28,70 +41,120 @@ class VelocityRule(PolicyRule):
     - delay_hours_above_usd: Add delay (in hours) above this amount
     """
     
-    async def evaluate(self, context: PolicyContext) -> PolicyDecision:
-        """Evaluate transaction against velocity limits."""
-        tx = context.transaction
+    def _compile_config(self) -> None:
+        """
+        Parse thresholds into Decimals once, at construction.
+        
+        Unset limits are stored as None so evaluate() can skip them.
+        Reason text that depends only on config is formatted here too.
+        """
+        max_daily = self.config.get("max_daily_usd")
+        self._max_daily = to_decimal(max_daily) if max_daily is not None else None
+        max_per_tx = self.config.get("max_per_tx_usd")
+        self._max_per_tx = to_decimal(max_per_tx) if max_per_tx is not None else None
+        self._per_tx_fmt = (
+            f"per-transaction limit of ${self._max_per_tx:,.2f}"
+            if self._max_per_tx is not None else None
+        )
         
-        # Get config values with defaults
-        max_daily = Decimal(str(self.config.get("max_daily_usd", float("inf"))))
-        max_per_tx = Decimal(str(self.config.get("max_per_tx_usd", float("inf"))))
         require_2fa_above = self.config.get("require_2fa_above_usd")
+        self._twofa_threshold = (
+            to_decimal(require_2fa_above) if require_2fa_above is not None else None
+        )
+        
         delay_above = self.config.get("delay_hours_above_usd")
+        self._delay_threshold = (
+            to_decimal(delay_above) if delay_above is not None else None
+        )
+        self._delay_hours = self.config.get("delay_hours", 24)
+        self._delay_seconds = None
+        self._delay_reason = None
+        if self._delay_threshold is not None:
+            self._delay_seconds = self._delay_hours * 3600
+            self._delay_reason = (
+                f"Transactions above ${self._delay_threshold:,.2f} require "
+                f"a {self._delay_hours}-hour delay"
+            )
+    
+    async def evaluate(self, context: PolicyContext) -> PolicyDecision:
+        """Evaluate transaction against velocity limits."""
+        return self._check(context.transaction)
+    
+    def evaluate_batch(
+        self,
+        transactions: Iterable["TransactionContext"]
+    ) -> list[PolicyDecision]:
+        """
+        Evaluate many transactions against the same velocity limits.
+        
+        Velocity decisions depend only on the transaction amounts, so
+        dry-run and replay callers can skip building a PolicyContext and
+        awaiting a coroutine per transaction.
+        """
+        check = self._check
+        return [check(tx) for tx in transactions]
+    
+    def _check(self, tx: "TransactionContext") -> PolicyDecision:
+        """Apply the compiled limits to a single transaction."""
+        self._check_config()
+        
+        max_daily = self._max_daily
+        max_per_tx = self._max_per_tx
         
         # Check per-transaction limit
-        if tx.value_usd > max_per_tx:
-            logger.info(
-                "Velocity rule: per-tx limit exceeded",
-                value_usd=float(tx.value_usd),
-                limit_usd=float(max_per_tx)
-            )
+        if max_per_tx is not None and tx.value_usd > max_per_tx:
+            if info_enabled():
+                logger.info(
+                    "Velocity rule: per-tx limit exceeded",
+                    value_usd=float(tx.value_usd),
+                    limit_usd=float(max_per_tx)
+                )
             return PolicyDecision.block(
                 reason=f"Transaction amount ${tx.value_usd:,.2f} exceeds "
-                       f"per-transaction limit of ${max_per_tx:,.2f}"
+                       f"{self._per_tx_fmt}"
             )
         
         # Check daily limit
-        projected_daily = tx.daily_outflow_usd + tx.value_usd
-        if projected_daily > max_daily:
-            remaining = max_daily - tx.daily_outflow_usd
-            logger.info(
-                "Velocity rule: daily limit exceeded",
-                daily_total=float(projected_daily),
-                limit_usd=float(max_daily)
-            )
-            return PolicyDecision.block(
-                reason=f"Transaction would exceed daily limit. "
-                       f"Remaining today: ${max(remaining, Decimal('0')):,.2f}"
-            )
+        if max_daily is not None:
+            projected_daily = tx.daily_outflow_usd + tx.value_usd
+            if projected_daily > max_daily:
+                remaining = max_daily - tx.daily_outflow_usd
+                if info_enabled():
+                    logger.info(
+                        "Velocity rule: daily limit exceeded",
+                        daily_total=float(projected_daily),
+                        limit_usd=float(max_daily)
+                    )
+                return PolicyDecision.block(
+                    reason=f"Transaction would exceed daily limit. "
+                           f"Remaining today: ${max(remaining, _ZERO):,.2f}"
+                )
         
         # Check if delay is required
-        if delay_above is not None:
-            delay_threshold = Decimal(str(delay_above))
-            if tx.value_usd > delay_threshold:
-                delay_hours = self.config.get("delay_hours", 24)
-                delay_seconds = delay_hours * 3600
+        delay_threshold = self._delay_threshold
+        if delay_threshold is not None and tx.value_usd > delay_threshold:
+            if info_enabled():
                 logger.info(
                     "Velocity rule: delay required",
                     value_usd=float(tx.value_usd),
                     threshold_usd=float(delay_threshold),
-                    delay_hours=delay_hours
-                )
-                return PolicyDecision.delay(
-                    seconds=delay_seconds,
-                    reason=f"Transactions above ${delay_threshold:,.2f} require "
-                           f"a {delay_hours}-hour delay"
+                    delay_hours=self._delay_hours
                 )
+            return PolicyDecision.delay(
+                seconds=self._delay_seconds,
+                reason=self._delay_reason
+            )
         
         # Check if 2FA is required
-        if require_2fa_above is not None:
-            twofa_threshold = Decimal(str(require_2fa_above))
-            if tx.value_usd > twofa_threshold:
+        twofa_threshold = self._twofa_threshold
+        if twofa_threshold is not None and tx.value_usd > twofa_threshold:
+            if info_enabled():
                 logger.info(
                     "Velocity rule: 2FA required",
                     value_usd=float(tx.value_usd),
                     threshold_usd=float(twofa_threshold)
                 )
-                return PolicyDecision.require_verification("2fa_required")
+            return PolicyDecision.require_verification("2fa_required")
         
         # All checks passed
         return PolicyDecision.allow()
@@ -102,7 +165,7 @@ class VelocityRule(PolicyRule):
         
         if "max_daily_usd" in self.config:
             try:
-                val = Decimal(str(self.config["max_daily_usd"]))
+                val = to_decimal(self.config["max_daily_usd"])
                 if val <= 0:
                     errors.append("max_daily_usd must be positive")
             except:
@@ -110,7 +173,7 @@ class VelocityRule(PolicyRule):
         
         if "max_per_tx_usd" in self.config:
             try:
-                val = Decimal(str(self.config["max_per_tx_usd"]))
+                val = to_decimal(self.config["max_per_tx_usd"])
                 if val <= 0:
                     errors.append("max_per_tx_usd must be positive")
             except:
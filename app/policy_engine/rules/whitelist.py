@@ -9,7 +9,12 @@ Controls which addresses can receive funds:
 
 import structlog
 
-from app.policy_engine.rules.base import PolicyRule, PolicyContext, PolicyDecision
+from app.policy_engine.rules.base import (
+    PolicyRule,
+    PolicyContext,
+    PolicyDecision,
+    info_enabled,
+)
 
 logger = structlog.get_logger(__name__)
 
@@ -24,67 +29,77 @@ class WhitelistRule(PolicyRule):
     - quarantine_hours_for_new: Delay (in hours) for new addresses
     """
     
+    def _compile_config(self) -> None:
+        """Read config options once, at construction."""
+        self._mode = self.config.get("mode", "warn_unknown")
+        self._require_2fa_new = self.config.get("require_2fa_for_new", False)
+        self._quarantine_hours = self.config.get("quarantine_hours_for_new")
+        self._quarantine_reason = (
+            f"New address requires {self._quarantine_hours}h quarantine"
+        )
+        self._known_address_decision = PolicyDecision.allow(
+            warnings=("Consider adding frequently used addresses to your whitelist",)
+        )
+    
     async def evaluate(self, context: PolicyContext) -> PolicyDecision:
         """Evaluate transaction against whitelist."""
-        tx = context.transaction
-        
-        # Get config
-        mode = self.config.get("mode", "warn_unknown")
-        require_2fa_new = self.config.get("require_2fa_for_new", False)
-        quarantine_hours = self.config.get("quarantine_hours_for_new")
+        self._check_config()
         
-        # Check if address is whitelisted
-        is_whitelisted = tx.address_in_whitelist
-        is_new = tx.is_new_address
+        tx = context.transaction
         
-        if is_whitelisted:
-            # Whitelisted address - always allow
+        # Whitelisted address - always allow, without looking further
+        if tx.address_in_whitelist:
             return PolicyDecision.allow()
         
-        if is_new:
-            logger.info(
-                "Whitelist rule: new address detected",
-                address=tx.to_address[:10] + "...",
-                mode=mode
-            )
-            
-            if mode == "block_unknown":
-                return PolicyDecision.block(
-                    reason=f"Address {tx.to_address[:10]}... is not in your whitelist. "
-                           "Add it to whitelist first."
-                )
-            
-            # Warn mode - allow with conditions
-            warnings = [
-                f"This is a new address not in your whitelist: {tx.to_address[:10]}..."
-            ]
-            
-            # Check quarantine
-            if quarantine_hours:
-                return PolicyDecision(
-                    allowed=True,
-                    delay_seconds=quarantine_hours * 3600,
-                    warnings=warnings,
-                    reason=f"New address requires {quarantine_hours}h quarantine"
+        if tx.is_new_address:
+            addr_short = tx.to_address[:10] + "..."
+            if info_enabled():
+                logger.info(
+                    "Whitelist rule: new address detected",
+                    address=addr_short,
+                    mode=self._mode
                 )
             
-            # Check 2FA requirement
-            if require_2fa_new:
-                return PolicyDecision(
-                    allowed=True,
-                    require_2fa=True,
-                    warnings=warnings,
-                    required_actions=["2fa_required"],
-                    reason="2FA required for new address"
-                )
-            
-            # Just warn
-            return PolicyDecision.allow(warnings=warnings)
+            return self._new_address_decision(addr_short)
         
         # Known address but not whitelisted - allow with warning
-        return PolicyDecision.allow(
-            warnings=["Consider adding frequently used addresses to your whitelist"]
+        return self._known_address_decision
+    
+    def _new_address_decision(self, addr_short: str) -> PolicyDecision:
+        """Build the decision for a new, non-whitelisted address."""
+        if self._mode == "block_unknown":
+            return PolicyDecision.block(
+                reason=f"Address {addr_short} is not in your whitelist. "
+                       "Add it to whitelist first."
+            )
+        
+        # Warn mode - allow with conditions
+        warnings = (
+            f"This is a new address not in your whitelist: {addr_short}",
         )
+        
+        # Check quarantine
+        quarantine_hours = self._quarantine_hours
+        if quarantine_hours:
+            return PolicyDecision(
+                allowed=True,
+                delay_seconds=quarantine_hours * 3600,
+                warnings=warnings,
+                reason=self._quarantine_reason
+            )
+        
+        # Check 2FA requirement
+        if self._require_2fa_new:
+            return PolicyDecision(
+                allowed=True,
+                require_2fa=True,
+                warnings=warnings,
+                required_actions=("2fa_required",),
+                reason="2FA required for new address"
+            )
+        
+        # Just warn
+        return PolicyDecision.allow(warnings=warnings)
     
     def validate_config(self) -> list[str]:
         """Validate whitelist rule configuration."""
@@ -96,7 +111,8 @@ class WhitelistRule(PolicyRule):
         
         quarantine = self.config.get("quarantine_hours_for_new")
         if quarantine is not None:
-            if not isinstance(quarantine, (int, float)) or quarantine < 0:
+            t = type(quarantine)
+            if (t is not int and t is not float) or quarantine < 0:
                 errors.append("quarantine_hours_for_new must be a positive number")
         
         return errors
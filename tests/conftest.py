@@ -8,6 +8,7 @@ Shared fixtures for all tests including:
 """
 
 import asyncio
+from functools import lru_cache
 from typing import AsyncGenerator, Generator
 
 import pytest
@@ -20,6 +21,7 @@ from app.config import Settings
 
 
 # Override settings for testing
+@lru_cache(maxsize=1)
 def get_test_settings() -> Settings:
     """Get settings configured for testing."""
     return Settings(
@@ -42,16 +44,26 @@ def event_loop() -> Generator:
     loop.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client() -> Generator:
-    """Create a synchronous test client."""
+    """
+    Create a synchronous test client.
+    
+    Shared across the session so app startup/shutdown runs once.
+    Tests pass auth via headers, so no per-test client state leaks.
+    """
     with TestClient(app) as c:
         yield c
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def async_client() -> AsyncGenerator:
-    """Create an async test client."""
+    """
+    Create an async test client.
+    
+    Shared across the session like the sync client; the transport
+    handles sequential requests, so one entered client is reused.
+    """
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
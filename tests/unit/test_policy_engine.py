@@ -9,8 +9,9 @@ Tests the core policy execution logic including:
 """
 
 import pytest
-from decimal import Decimal
-from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
 
 from app.policy_engine.executor import (
     PolicyExecutor,
@@ -20,7 +21,19 @@ from app.policy_engine.executor import (
 from app.policy_engine.rules.velocity import VelocityRule
 from app.policy_engine.rules.whitelist import WhitelistRule
 from app.policy_engine.rules.timelock import TimelockRule
-from app.policy_engine.rules.base import PolicyContext
+from app.policy_engine.rules.base import PolicyContext, PolicyDecision, PolicyRule
+
+
+class StaticRule(PolicyRule):
+    """Rule that always returns a fixed decision, for aggregation tests."""
+    
+    def __init__(self, name: str, decision: PolicyDecision):
+        super().__init__(name=name, config={})
+        self.decision = decision
+    
+    async def evaluate(self, context: PolicyContext) -> PolicyDecision:
+        """Return the fixed decision."""
+        return self.decision
 
 
 class TestVelocityRule:
@@ -131,6 +144,68 @@ class TestVelocityRule:
         
         assert decision.allowed is True
         assert decision.require_2fa is True
+    
+    def test_rejects_boolean_thresholds(self):
+        """Booleans are not valid limit amounts."""
+        for value in (True, False):
+            rule = VelocityRule(
+                name="Bad",
+                config={"max_daily_usd": value, "max_per_tx_usd": value}
+            )
+            
+            assert rule.validate_config() == [
+                "max_daily_usd must be a valid number",
+                "max_per_tx_usd must be a valid number"
+            ]
+    
+    @pytest.mark.asyncio
+    async def test_invalid_config_raises_on_evaluate(
+        self,
+        transaction_context: TransactionContext
+    ):
+        """A bad config should surface its parse error when evaluated."""
+        rule = VelocityRule(name="Bad", config={"max_per_tx_usd": "abc"})
+        context = PolicyContext(
+            transaction=transaction_context,
+            user_tier="humpback",
+            current_time=datetime.utcnow()
+        )
+        
+        with pytest.raises(InvalidOperation):
+            await rule.evaluate(context)
+        with pytest.raises(InvalidOperation):
+            rule.evaluate_batch([transaction_context])
+    
+    @pytest.mark.asyncio
+    async def test_batch_matches_single_evaluation(
+        self,
+        velocity_rule: VelocityRule,
+        transaction_context: TransactionContext
+    ):
+        """Batch evaluation should give the same decisions as evaluate()."""
+        transactions = []
+        for value in ("5000", "15000", "30000", "45000"):
+            tx = TransactionContext(
+                chain=transaction_context.chain,
+                to_address=transaction_context.to_address,
+                value_native=transaction_context.value_native,
+                value_usd=Decimal(value),
+                daily_outflow_usd=transaction_context.daily_outflow_usd
+            )
+            transactions.append(tx)
+        
+        batch = velocity_rule.evaluate_batch(transactions)
+        
+        for tx, decision in zip(transactions, batch):
+            context = PolicyContext(
+                transaction=tx,
+                user_tier="humpback",
+                current_time=datetime.utcnow()
+            )
+            single = await velocity_rule.evaluate(context)
+            assert decision.allowed == single.allowed
+            assert decision.require_2fa == single.require_2fa
+            assert decision.reason == single.reason
 
 
 class TestWhitelistRule:
@@ -222,6 +297,160 @@ class TestWhitelistRule:
         assert decision.delay_seconds == 24 * 3600
 
 
+class TestTimelockRule:
+    """Tests for timelock rule."""
+    
+    @pytest.fixture
+    def transaction_context(self) -> TransactionContext:
+        """Create a transaction context for testing."""
+        return TransactionContext(
+            chain="ethereum",
+            to_address="0x123",
+            value_native=Decimal("1"),
+            value_usd=Decimal("5000")
+        )
+    
+    @staticmethod
+    def _context(tx: TransactionContext, when: datetime) -> PolicyContext:
+        """Build a policy context at a given (aware) time."""
+        return PolicyContext(transaction=tx, user_tier="humpback", current_time=when)
+    
+    @pytest.mark.asyncio
+    async def test_blocks_overnight_window(self, transaction_context: TransactionContext):
+        """A 22:00-06:00 window should block across midnight only."""
+        rule = TimelockRule(
+            name="Night",
+            config={"block_start_hour": 22, "block_end_hour": 6, "timezone": "UTC"}
+        )
+        day = datetime(2024, 3, 6, tzinfo=timezone.utc)  # Wednesday
+        
+        expected = {hour: hour >= 22 or hour < 6 for hour in range(24)}
+        assert rule._blocked_mask == sum(1 << h for h, b in expected.items() if b)
+        
+        for hour, blocked in expected.items():
+            context = self._context(transaction_context, day + timedelta(hours=hour))
+            decision = await rule.evaluate(context)
+            assert decision.allowed is not blocked, hour
+        
+        decision = await rule.evaluate(
+            self._context(transaction_context, day + timedelta(hours=23))
+        )
+        assert "Try again in ~7 hours" in decision.reason
+    
+    @pytest.mark.asyncio
+    async def test_follows_dst_transition(self, transaction_context: TransactionContext):
+        """Local hours should track America/New_York across spring-forward."""
+        rule = TimelockRule(
+            name="Early",
+            config={
+                "block_start_hour": 3,
+                "block_end_hour": 4,
+                "timezone": "America/New_York"
+            }
+        )
+        
+        # Clocks jump from 02:00 EST to 03:00 EDT at 07:00 UTC
+        before = datetime(2024, 3, 10, 6, 30, tzinfo=timezone.utc)  # 01:30 EST
+        after = datetime(2024, 3, 10, 7, 30, tzinfo=timezone.utc)  # 03:30 EDT
+        
+        assert (await rule.evaluate(self._context(transaction_context, before))).allowed
+        assert not (await rule.evaluate(self._context(transaction_context, after))).allowed
+        
+        # Every minute around the transition agrees with astimezone()
+        zone = ZoneInfo("America/New_York")
+        when = datetime(2024, 3, 10, 5, 0, tzinfo=timezone.utc)
+        while when < datetime(2024, 3, 10, 9, 0, tzinfo=timezone.utc):
+            local = when.astimezone(zone)
+            assert rule._local_hour_and_weekday(when) == (local.hour, local.weekday())
+            when += timedelta(minutes=1)
+    
+    @pytest.mark.asyncio
+    async def test_handles_half_hour_offset(self, transaction_context: TransactionContext):
+        """Asia/Kolkata (UTC+05:30) should shift hour boundaries by 30 minutes."""
+        rule = TimelockRule(
+            name="Morning",
+            config={
+                "block_start_hour": 9,
+                "block_end_hour": 10,
+                "timezone": "Asia/Kolkata"
+            }
+        )
+        
+        at_0845 = datetime(2024, 3, 6, 3, 15, tzinfo=timezone.utc)
+        at_0915 = datetime(2024, 3, 6, 3, 45, tzinfo=timezone.utc)
+        
+        assert (await rule.evaluate(self._context(transaction_context, at_0845))).allowed
+        assert not (await rule.evaluate(self._context(transaction_context, at_0915))).allowed
+        
+        # Lord Howe shifts by 30 minutes at 15:30 UTC, mid-way through a
+        # UTC hour; that hour must fall back to a full conversion
+        lord_howe = TimelockRule(name="LH", config={"timezone": "Australia/Lord_Howe"})
+        zone = ZoneInfo("Australia/Lord_Howe")
+        when = datetime(2024, 10, 6, 14, 0, tzinfo=timezone.utc)
+        while when < datetime(2024, 10, 6, 17, 0, tzinfo=timezone.utc):
+            local = when.astimezone(zone)
+            assert lord_howe._local_hour_and_weekday(when) == (local.hour, local.weekday())
+            when += timedelta(minutes=1)
+    
+    @pytest.mark.asyncio
+    async def test_blocks_weekends(self, transaction_context: TransactionContext):
+        """Weekend blocking should apply on Saturday and Sunday only."""
+        rule = TimelockRule(name="Weekend", config={"block_weekends": True})
+        
+        saturday = datetime(2024, 3, 9, 12, tzinfo=timezone.utc)
+        monday = datetime(2024, 3, 11, 12, tzinfo=timezone.utc)
+        
+        decision = await rule.evaluate(self._context(transaction_context, saturday))
+        assert decision.allowed is False
+        assert "weekends" in decision.reason
+        assert (await rule.evaluate(self._context(transaction_context, monday))).allowed
+    
+    @pytest.mark.asyncio
+    async def test_invalid_timezone_falls_back(self, transaction_context: TransactionContext):
+        """An invalid zone should fail validation and evaluate on the given time."""
+        rule = TimelockRule(
+            name="Night",
+            config={
+                "block_start_hour": 22,
+                "block_end_hour": 6,
+                "timezone": "Not/AZone"
+            }
+        )
+        
+        assert "Invalid timezone: Not/AZone" in rule.validate_config()
+        
+        late = datetime(2024, 3, 6, 23, tzinfo=timezone.utc)
+        noon = datetime(2024, 3, 6, 12, tzinfo=timezone.utc)
+        assert not (await rule.evaluate(self._context(transaction_context, late))).allowed
+        assert (await rule.evaluate(self._context(transaction_context, noon))).allowed
+    
+    @pytest.mark.asyncio
+    async def test_memoizes_decisions_per_hour(self, transaction_context: TransactionContext):
+        """Evaluations in the same local hour and weekday share one decision."""
+        rule = TimelockRule(
+            name="Night",
+            config={"block_start_hour": 22, "block_end_hour": 6}
+        )
+        
+        first = datetime(2024, 3, 6, 23, 5, tzinfo=timezone.utc)
+        second = datetime(2024, 3, 6, 23, 55, tzinfo=timezone.utc)
+        next_day = datetime(2024, 3, 7, 23, 5, tzinfo=timezone.utc)
+        
+        a = await rule.evaluate(self._context(transaction_context, first))
+        b = await rule.evaluate(self._context(transaction_context, second))
+        c = await rule.evaluate(self._context(transaction_context, next_day))
+        
+        assert a is b
+        assert c is not a
+        assert c.reason == a.reason
+        
+        # Shared decisions cannot be changed by a caller
+        with pytest.raises(AttributeError):
+            a.reason = "changed"
+        with pytest.raises(AttributeError):
+            a.warnings.append("changed")
+
+
 class TestPolicyExecutor:
     """Tests for the policy executor."""
     
@@ -278,3 +507,220 @@ class TestPolicyExecutor:
         # Should aggregate both rules
         assert len(result.rules_evaluated) == 2
         assert result.decision == DecisionType.REQUIRE_2FA
+    
+    @pytest.fixture
+    def new_address_tx(self) -> TransactionContext:
+        """Create a transaction to a new, non-whitelisted address."""
+        return TransactionContext(
+            chain="ethereum",
+            to_address="0x123",
+            value_native=Decimal("1"),
+            value_usd=Decimal("5000"),
+            is_new_address=True
+        )
+    
+    @pytest.fixture
+    def blocking_rules(self) -> list[PolicyRule]:
+        """Rules where the highest-priority rule blocks new_address_tx."""
+        return [
+            VelocityRule(
+                name="Velocity",
+                config={"max_per_tx_usd": 1000},  # Blocks
+                priority=10
+            ),
+            WhitelistRule(
+                name="Whitelist",
+                config={"mode": "warn_unknown"},
+                priority=5
+            )
+        ]
+    
+    @pytest.fixture
+    def allowing_rules(self) -> list[PolicyRule]:
+        """Rules that all allow new_address_tx, with 2FA and a warning."""
+        return [
+            VelocityRule(
+                name="Velocity",
+                config={"require_2fa_above_usd": 1000},  # Requires 2FA
+                priority=10
+            ),
+            WhitelistRule(
+                name="Whitelist",
+                config={"mode": "warn_unknown"},  # Warns
+                priority=5
+            ),
+            TimelockRule(
+                name="Timelock",
+                config={},  # Allows
+                priority=1
+            )
+        ]
+    
+    @pytest.mark.asyncio
+    async def test_stops_at_first_block(
+        self,
+        blocking_rules: list[PolicyRule],
+        new_address_tx: TransactionContext
+    ):
+        """Executor should skip lower-priority rules once a rule blocks."""
+        result = await PolicyExecutor(rules=list(blocking_rules)).execute(new_address_tx)
+        
+        assert result.decision == DecisionType.BLOCK
+        assert result.blocking_rule == "Velocity"
+        assert result.rules_evaluated == ["Velocity"]
+        
+        # strict_audit evaluates every rule for the full trail
+        audit = await PolicyExecutor(
+            rules=list(blocking_rules), strict_audit=True
+        ).execute(new_address_tx)
+        
+        assert audit.decision == DecisionType.BLOCK
+        assert audit.rules_evaluated == ["Velocity", "Whitelist"]
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_matches_sequential(
+        self,
+        blocking_rules: list[PolicyRule],
+        allowing_rules: list[PolicyRule],
+        new_address_tx: TransactionContext
+    ):
+        """Concurrent evaluation should give the same result as sequential."""
+        for rules in (blocking_rules, allowing_rules):
+            sequential = await PolicyExecutor(rules=list(rules)).execute(new_address_tx)
+            concurrent = await PolicyExecutor(
+                rules=list(rules), concurrent=True
+            ).execute(new_address_tx)
+            
+            assert concurrent.decision == sequential.decision
+            assert concurrent.blocking_rule == sequential.blocking_rule
+            assert concurrent.rules_evaluated == sequential.rules_evaluated
+            assert concurrent.warnings == sequential.warnings
+            assert concurrent.required_actions == sequential.required_actions
+        
+        # Every allowing rule ran and contributed to the result
+        assert concurrent.decision == DecisionType.REQUIRE_2FA
+        assert concurrent.rules_evaluated == ["Velocity", "Whitelist", "Timelock"]
+        assert concurrent.warnings
+    
+    @pytest.mark.asyncio
+    async def test_invalid_config_fails_closed_without_leaking(self):
+        """Re-raising a stored config error should not grow its traceback."""
+        rule = VelocityRule(name="Bad", config={"max_per_tx_usd": "abc"})
+        executor = PolicyExecutor(rules=[rule])
+        
+        tx = TransactionContext(
+            chain="ethereum",
+            to_address="0x123",
+            value_native=Decimal("1"),
+            value_usd=Decimal("100")
+        )
+        
+        for _ in range(50):
+            result = await executor.execute(tx)
+            assert result.decision == DecisionType.BLOCK
+            assert result.blocking_rule == "Bad (evaluation error)"
+        
+        depth = 0
+        tb = rule.config_error.__traceback__
+        while tb is not None:
+            depth += 1
+            tb = tb.tb_next
+        assert depth < 10
+    
+    @pytest.mark.asyncio
+    async def test_block_after_delay_reports_no_delay(self):
+        """A BLOCK should win over an earlier DELAY and carry no delay."""
+        executor = PolicyExecutor(rules=[
+            StaticRule("Delay", PolicyDecision.delay(seconds=3600, reason="wait")),
+            StaticRule("Block", PolicyDecision.block(reason="no"))
+        ])
+        tx = TransactionContext(
+            chain="ethereum",
+            to_address="0x123",
+            value_native=Decimal("1"),
+            value_usd=Decimal("100")
+        )
+        
+        result = await executor.execute(tx)
+        
+        assert result.decision == DecisionType.BLOCK
+        assert result.blocking_rule == "Block"
+        assert result.delay_seconds is None
+        assert result.rules_evaluated == ["Delay", "Block"]
+    
+    @pytest.mark.asyncio
+    async def test_delay_after_2fa_does_not_add_2fa_action(self):
+        """A DELAY outranks 2FA, so the executor adds no 2fa_required action."""
+        tx = TransactionContext(
+            chain="ethereum",
+            to_address="0x123",
+            value_native=Decimal("1"),
+            value_usd=Decimal("100")
+        )
+        twofa = StaticRule("2FA", PolicyDecision(require_2fa=True))
+        delay = StaticRule("Delay", PolicyDecision.delay(seconds=3600, reason="wait"))
+        
+        result = await PolicyExecutor(rules=[twofa, delay]).execute(tx)
+        
+        assert result.decision == DecisionType.DELAY
+        assert result.blocking_rule == "Delay"
+        assert result.delay_seconds == 3600
+        assert result.required_actions == []
+        
+        # 2FA on its own is the final decision and gets the action
+        result = await PolicyExecutor(rules=[twofa]).execute(tx)
+        
+        assert result.decision == DecisionType.REQUIRE_2FA
+        assert result.required_actions == ["2fa_required"]
+    
+    def test_reuses_compiled_rules_for_same_policies(self, sample_policy: dict):
+        """Loading unchanged policies should reuse the compiled rules."""
+        executor = PolicyExecutor()
+        executor.register_rule("velocity", VelocityRule)
+        
+        executor.load_rules_from_config([sample_policy])
+        first = executor.rules
+        executor.load_rules_from_config([dict(sample_policy)])
+        
+        assert executor.rules is first
+        
+        changed = {**sample_policy, "config": {"max_per_tx_usd": 1}}
+        executor.load_rules_from_config([changed])
+        
+        assert executor.rules is not first
+        assert executor.rules[0].config == {"max_per_tx_usd": 1}
+    
+    def test_distinguishes_equal_values_of_different_types(self, sample_policy: dict):
+        """Configs differing only in value type should not share rules."""
+        executor = PolicyExecutor()
+        executor.register_rule("velocity", VelocityRule)
+        
+        as_int = {**sample_policy, "config": {"delay_hours": 24}}
+        as_float = {**sample_policy, "config": {"delay_hours": 24.0}}
+        
+        executor.load_rules_from_config([as_int])
+        int_rule = executor.rules[0]
+        executor.load_rules_from_config([as_float])
+        
+        assert executor.rules[0] is not int_rule
+        assert executor.rules[0].config is as_float["config"]
+    
+    def test_shares_rule_instances_across_policy_sets(self, sample_policy: dict):
+        """Identical policies in different sets should reuse one rule object."""
+        executor = PolicyExecutor()
+        executor.register_rule("velocity", VelocityRule)
+        executor.register_rule("whitelist", WhitelistRule)
+        
+        whitelist_policy = {
+            "rule_type": "whitelist",
+            "name": "Whitelist",
+            "config": {"mode": "warn_unknown"},
+            "priority": 5
+        }
+        
+        executor.load_rules_from_config([sample_policy])
+        velocity = executor.rules[0]
+        executor.load_rules_from_config([sample_policy, whitelist_policy])
+        
+        assert len(executor.rules) == 2
+        assert executor.rules[0] is velocity
@@ -0,0 +1,70 @@
+"""
+Unit Tests for Security Utilities
+
+Tests the cryptographic helpers including:
+- Encryption at rest
+- Address derivation
+"""
+
+import pytest
+from cryptography.exceptions import InvalidTag
+from eth_hash.auto import keccak
+
+from app.core.security import EncryptionService, derive_address_from_pubkey
+
+
+# secp256k1 generator point G, i.e. the public key for private key 1
+# (uncompressed, without the 0x04 prefix)
+GENERATOR_PUBKEY = bytes.fromhex(
+    "79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798"
+    "483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8"
+)
+
+
+class TestEncryptionService:
+    """Tests for AES-GCM encryption at rest."""
+    
+    @pytest.fixture
+    def service(self) -> EncryptionService:
+        """Create an encryption service with a fixed test key."""
+        return EncryptionService(master_key="test-encryption-key-32-bytes-xx")
+    
+    def test_string_round_trip(self, service: EncryptionService):
+        """encrypt/decrypt should round-trip text, with a fresh nonce each time."""
+        ciphertext = service.encrypt("seed shard \u00e9")
+        
+        assert service.decrypt(ciphertext) == "seed shard \u00e9"
+        assert service.encrypt("seed shard \u00e9") != ciphertext
+    
+    def test_bytes_round_trip(self, service: EncryptionService):
+        """encrypt_bytes/decrypt_bytes should round-trip raw bytes."""
+        plaintext = bytes(range(256))
+        ciphertext = service.encrypt_bytes(plaintext)
+        
+        # nonce (12) + ciphertext + tag (16)
+        assert len(ciphertext) == 12 + len(plaintext) + 16
+        assert service.decrypt_bytes(ciphertext) == plaintext
+    
+    def test_tampered_ciphertext_is_rejected(self, service: EncryptionService):
+        """Any modified byte should fail authentication."""
+        ciphertext = bytearray(service.encrypt_bytes(b"secret"))
+        ciphertext[-1] ^= 0x01
+        
+        with pytest.raises(InvalidTag):
+            service.decrypt_bytes(bytes(ciphertext))
+
+
+class TestAddressDerivation:
+    """Tests for address derivation from public keys."""
+    
+    def test_keccak_is_not_nist_sha3(self):
+        """Ethereum hashing must be Keccak-256, not NIST SHA3-256."""
+        assert keccak(b"").hex() == (
+            "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"
+        )
+    
+    def test_derives_known_ethereum_address(self):
+        """Private key 1 has a well-known Ethereum address."""
+        address = derive_address_from_pubkey(GENERATOR_PUBKEY, "ethereum")
+        
+        assert address == "0x7e5f4552091a69125d5dfcb7b8c2659029395bdf"